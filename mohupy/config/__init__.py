@@ -5,5 +5,5 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
-from .main import Config, set_mtype, set_approx
-__all__ = ['Config', 'set_mtype', 'set_approx']
+from .main import Config, set_mtype, set_approx, set_chunksize
+__all__ = ['Config', 'set_mtype', 'set_approx', 'set_chunksize']
@@ -13,6 +13,12 @@ class Config:
     mtype = 'qrofn'
     enable_backprop = True
 
+    # Out-of-core (memory-mapped) fuzzy arrays are processed in blocks of about
+    # 'chunksize' elements. Their results larger than one block are written to
+    # temporary memory-mapped files in 'tmpdir' (None: the system default).
+    chunksize = 2 ** 22
+    tmpdir = None
+
     mtype_dict = FuzzType
 
 
@@ -29,3 +35,8 @@ def set_approx(approx):
     Approx.round = approx
 
 
+def set_chunksize(chunksize: int, tmpdir=None):
+    if chunksize <= 0:
+        raise ValueError(f'Invalid chunk size: {chunksize}.')
+    Config.chunksize = int(chunksize)
+    Config.tmpdir = tmpdir
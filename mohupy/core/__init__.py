@@ -10,17 +10,18 @@ __all__ = []
 from .base import FuzzType
 from .fuzzarray import Fuzzarray
 from .fuzznums import Fuzznum
+from .ragged import RaggedArray
 
 from .regedit import Registry
-from .operationLib import archimedeanDict
+from .operationLib import archimedeanDict, reductionDict
 
 from .operationpackage import *
 
-__all__ += ['FuzzType', 'Fuzzarray', 'Fuzznum',
-            'Registry', 'archimedeanDict']
+__all__ += ['FuzzType', 'Fuzzarray', 'Fuzznum', 'RaggedArray',
+            'Registry', 'archimedeanDict', 'reductionDict']
 
-from .construct import fuzznum, fuzzset
-__all__ += ['fuzznum', 'fuzzset']
+from .construct import fuzznum, fuzzset, fuzzset_from_arrays
+__all__ += ['fuzznum', 'fuzzset', 'fuzzset_from_arrays']
 
 from .constant import Approx
 __all__ += ['Approx']
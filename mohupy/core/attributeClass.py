@@ -67,6 +67,29 @@ class Str(Attribute):
         raise TypeError(f'Unsupported data types:{type(x)}.')
 
 
+def powers(x):
+    """
+        The q-th powers of the degrees of every element of a Fuzzarray, as two
+        float64 ndarrays of shape 'x.shape': md^q and nmd^q for q-rofn, their
+        sums over the lower and upper bounds for ivfn, and their means over all
+        degrees for q-rohfn (nan for an element without degrees).
+    """
+    md, nmd = x.columns
+    q = x.qrung
+    if x.mtype == 'qrofn':
+        return md ** q, nmd ** q
+    if x.mtype == 'ivfn':
+        return md[..., 0] ** q + md[..., 1] ** q, nmd[..., 0] ** q + nmd[..., 1] ** q
+    if x.mtype == 'qrohfn':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mm = md.apply(lambda v: v ** q).reduce(np.add) / md.lengths
+            nn = nmd.apply(lambda v: v ** q).reduce(np.add) / nmd.lengths
+        nan = np.isnan(mm) | np.isnan(nn)
+        mm[nan], nn[nan] = np.nan, np.nan
+        return mm, nn
+    raise TypeError(f'Unsupported mtype: {x.mtype}.')
+
+
 class Score(Attribute):
     def function(self, x):
         if isinstance(x, Fuzznum):
@@ -84,8 +107,10 @@ class Score(Attribute):
                     nn = ((x.nmd ** x.qrung).sum()) / len(x.nmd)
                     return mm - nn
         if isinstance(x, Fuzzarray):
-            # TODO: 模糊集
-            pass
+            m, n = powers(x)
+            if x.mtype == 'ivfn':
+                return (m - n) / 2
+            return m - n
 
 
 class Accuracy(Attribute):
@@ -105,8 +130,10 @@ class Accuracy(Attribute):
                     nn = ((x.nmd ** x.qrung).sum()) / len(x.nmd)
                     return mm + nn
         if isinstance(x, Fuzzarray):
-            # TODO: 模糊集
-            pass
+            m, n = powers(x)
+            if x.mtype == 'ivfn':
+                return (m + n) / 2
+            return m + n
 
 
 class Indeterminacy(Attribute):
@@ -136,8 +163,61 @@ class Indeterminacy(Attribute):
                     else:
                         return (1. - mm - nn) ** (1. / x.qrung)
         if isinstance(x, Fuzzarray):
-            # TODO: 模糊集
-            pass
+            m, n = powers(x)
+            with np.errstate(invalid='ignore'):
+                if x.mtype == 'qrofn':
+                    acc = m + n
+                    return np.where(acc == np.round(1., Approx.round),
+                                    np.round(0., Approx.round), (1. - acc) ** (1. / x.qrung))
+                if x.mtype == 'ivfn':
+                    return np.where(m + n != 0, np.round(0., Approx.round),
+                                    (1. - (m + n) / 2) ** (1. / x.qrung))
+                return np.where(m + n == 1., np.round(0., Approx.round),
+                                (1. - m - n) ** (1. / x.qrung))
+
+
+class Membership(Attribute):
+    """
+        The membership degrees of the elements of a Fuzzarray, in the same
+        layout in both storage modes: a float64 ndarray for q-rofn, otherwise
+        an object ndarray holding one degree array per element. The result
+        is a new, writable array.
+    """
+
+    def function(self, x):
+        if isinstance(x, Fuzzarray):
+            return degrees(x, 'md')
+        return x.md
+
+
+class NonMembership(Attribute):
+    """
+        The non-membership degrees of the elements of a Fuzzarray, see
+        Membership.
+    """
+
+    def function(self, x):
+        if isinstance(x, Fuzzarray):
+            return degrees(x, 'nmd')
+        return x.nmd
+
+
+def degrees(x, name):
+    if x.mtype == 'qrofn':
+        md, nmd = x.columns
+        return np.array(md if name == 'md' else nmd)
+    if x.columnar:
+        from .ragged import RaggedArray
+        d = x.columns[0 if name == 'md' else 1]
+        # 区间型每个元素占最后一维，犹豫型按行取出
+        rows = [d.row(i) for i in range(d.size)] if isinstance(d, RaggedArray) else d.reshape(-1, 2)
+    else:
+        flat = [x.array] if isinstance(x.array, Fuzznum) else x.array.ravel()
+        rows = [getattr(e, name) for e in flat]
+    arr = np.empty(len(rows), dtype=object)
+    for i, r in enumerate(rows):
+        arr[i] = np.array(r, dtype=object)
+    return arr.reshape(x.shape)
 
 
 class Complement(Attribute):
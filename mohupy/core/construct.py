@@ -43,24 +43,30 @@ class FuzzSet(Construct):
         if isinstance(x, Fuzzarray):
             return x
         if isinstance(x, Union[list, tuple, np.ndarray]):
+            from ..config import Config
             y = np.asarray(x, dtype=object)
+            if y.size == 0:
+                newset = Fuzzarray()
+                newset.array = y
+                return newset
 
-            t = np.random.choice(y)
-            qrung = t.qrung
+            first = y.flat[0]
+            if not isinstance(first, Fuzznum):
+                raise TypeError(f'Unsupported type: {type(first)}.')
+            qrung = first.qrung
 
-            def checkdata(data: Fuzznum):
-                from ..config import Config
+            # 一次遍历检查所有元素的类型、模糊类型与 Q 阶
+            for data in y.flat:
+                if not isinstance(data, Fuzznum):
+                    raise TypeError(f'Unsupported type: {type(data)}.')
                 if data.mtype != Config.mtype:
                     raise TypeError(f'Fuzzy type {data.mtype} and {Config.mtype} do not match.')
                 if data.qrung != qrung:
                     raise TypeError(f'Fuzzy qrung {data.qrung} and {qrung} do not match.')
-                return True
 
-            vec_checkdata = np.vectorize(checkdata)
-            if np.all(vec_checkdata(y)):
-                newset = Fuzzarray(qrung)
-                newset.array = y
-                return newset
+            newset = Fuzzarray(qrung)
+            newset.array = y
+            return newset
         raise TypeError(f'Unsupported type: {type(x)}.')
 
 
@@ -91,9 +97,89 @@ class FuzzSet(Construct):
         # raise TypeError(f'Unsupported type: {type(x)}.')
 
 
+class FuzzSetFromArrays(Construct):
+    """
+        Build a columnar fuzzy array directly from arrays of membership and
+        non-membership degrees of 'mtype' (default is Config.mtype), without
+        creating a Fuzznum per element.
+
+        For 'qrofn' md and nmd are float arrays of the same shape, for 'ivfn'
+        their last axis holds the (lower, upper) bounds, and for 'qrohfn' they
+        are RaggedArray or object arrays of 1-D degree arrays. With 'validate'
+        the degrees are checked as in InitializeNum by whole-array comparisons;
+        'validate=False' skips the checks for trusted data. The degrees are
+        rounded to Approx.round in both cases.
+    """
+
+    def __init__(self, qrung, validate=True, mtype=None):
+        assert qrung is not None and qrung > 0, f'Qrung must be greater than 0, qrung:{qrung}.'
+        self.qrung = qrung
+        self.validate = validate
+        self.mtype = mtype
+
+    def function(self, md, nmd):
+        from ..config import Config
+        from .fuzzarray import COLUMN_NDIM, RAGGED
+        from .ragged import RaggedArray
+        from .constant import Approx
+
+        mtype = Config.mtype if self.mtype is None else self.mtype
+        if mtype in RAGGED:
+            md, nmd = (t if isinstance(t, RaggedArray) else
+                       RaggedArray.from_rows(np.asarray(t, dtype=object).ravel(), np.shape(t))
+                       for t in (md, nmd))
+            assert md.shape == nmd.shape, \
+                f'The shapes of md and nmd do not match: {md.shape} and {nmd.shape}.'
+            if self.validate:
+                self.__check_ragged(md, nmd)
+            md = md.apply(lambda d: np.round(d, Approx.round))
+            nmd = nmd.apply(lambda d: np.round(d, Approx.round))
+        elif mtype in COLUMN_NDIM:
+            md = np.asarray(md, dtype=np.float64)
+            nmd = np.asarray(nmd, dtype=np.float64)
+            assert md.shape == nmd.shape, \
+                f'The shapes of md and nmd do not match: {md.shape} and {nmd.shape}.'
+            if self.validate:
+                self.__check(md, nmd, COLUMN_NDIM[mtype])
+            md = np.round(md, Approx.round)
+            nmd = np.round(nmd, Approx.round)
+        else:
+            raise TypeError(f'Unsupported mtype: {mtype}.')
+
+        newset = Fuzzarray(self.qrung)
+        newset.mtype = mtype
+        newset.columns = (md, nmd)
+        return newset
+
+    def __check(self, md, nmd, tail):
+        q = self.qrung
+        if tail:
+            assert md.ndim >= 1 and md.shape[-1] == 2, \
+                'ERROR: The data format contains at least upper and lower bounds.'
+            assert np.all(md[..., 0] <= md[..., 1]) and np.all(nmd[..., 0] <= nmd[..., 1]), \
+                'ERROR: The upper of membership and non-membership must be greater than the lower.'
+        assert np.all((0. <= md) & (md <= 1.)) and np.all((0. <= nmd) & (nmd <= 1.)), \
+            'ERROR: md and nmd must be between ZERO and ONE.'
+        assert np.all(md ** q + nmd ** q <= 1.), \
+            'ERROR: md ** qrung + nmd ** qrung must be between ZERO and ONE.'
+
+    def __check_ragged(self, md, nmd):
+        q = self.qrung
+        assert np.all((0. <= md.values) & (md.values <= 1.)) and \
+               np.all((0. <= nmd.values) & (nmd.values <= 1.)), \
+            'ERROR: must be in [0,1].'
+        # 与 InitializeNum 一致，以每个元素的最大隶属度与最大非隶属度检查
+        assert np.all(md.reduce(np.maximum, 0.) ** q + nmd.reduce(np.maximum, 0.) ** q <= 1.), \
+            'ERROR: max(md) ** qrung + max(nmd) ** qrung must be between ZERO and ONE.'
+
+
 def fuzznum(qrung=None, md=None, nmd=None) -> Fuzznum:
     return FuzzNum()(qrung, md, nmd)
 
 
 def fuzzset(x=None) -> Fuzzarray:
     return FuzzSet()(x)
+
+
+def fuzzset_from_arrays(md, nmd, qrung, validate=True) -> Fuzzarray:
+    return FuzzSetFromArrays(qrung, validate)(md, nmd)
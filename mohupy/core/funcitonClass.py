@@ -103,6 +103,131 @@ class InitializeSet(Function):
         return qrung, Config.mtype
 
 
+class FuzzElement(Function):
+    """
+        Build a Fuzznum directly from degrees that are already known to be
+        valid, skipping the checks of InitializeNum. It is used to create the
+        elements of a columnar Fuzzarray.
+    """
+
+    def __init__(self, qrung, mtype):
+        self.qrung = qrung
+        self.mtype = mtype
+
+    def function(self, md, nmd):
+        newfn = Fuzznum()
+        newfn.qrung = self.qrung
+        newfn.mtype = self.mtype
+        newfn.size = 1
+        if np.ndim(md) == 0:
+            newfn.md = np.float64(md)
+            newfn.nmd = np.float64(nmd)
+        else:
+            newfn.md = np.array(md, dtype=np.float64)
+            newfn.nmd = np.array(nmd, dtype=np.float64)
+        return newfn
+
+
+class FuzzColumns(Function):
+    """
+        Gather the membership and non-membership degrees of an object-mode
+        Fuzzarray into two float64 ndarrays of shape 'shape + element shape',
+        or into two RaggedArray for hesitant mtypes.
+    """
+
+    def function(self, x):
+        from .fuzzarray import COLUMN_NDIM, RAGGED
+        flat = [x.array] if isinstance(x.array, Fuzznum) else x.array.ravel()
+        if x.mtype in RAGGED:
+            from .ragged import RaggedArray
+            if x.size == 0:
+                flat = []
+            md = RaggedArray.from_rows([e.md for e in flat], x.shape)
+            nmd = RaggedArray.from_rows([e.nmd for e in flat], x.shape)
+            return md, nmd
+
+        if x.mtype not in COLUMN_NDIM:
+            raise TypeError(f'Columnar storage does not support mtype: {x.mtype}.')
+        tail = (2,) * COLUMN_NDIM[x.mtype]
+        if x.size == 0:
+            return np.empty(x.shape + tail), np.empty(x.shape + tail)
+
+        if tail:
+            md = np.array([e.md for e in flat], dtype=np.float64)
+            nmd = np.array([e.nmd for e in flat], dtype=np.float64)
+        else:
+            md = np.fromiter((e.md for e in flat), dtype=np.float64, count=x.size)
+            nmd = np.fromiter((e.nmd for e in flat), dtype=np.float64, count=x.size)
+        return md.reshape(x.shape + tail), nmd.reshape(x.shape + tail)
+
+
+class FuzzMaterialize(Function):
+    """
+        Build the object ndarray of Fuzznum of a columnar Fuzzarray.
+    """
+
+    def function(self, x):
+        from .fuzzarray import RAGGED
+        md, nmd = x.columns
+        if x.size == 0:
+            return np.array([], dtype=object)
+
+        element = FuzzElement(x.qrung, x.mtype)
+        if x.mtype in RAGGED:
+            if x.ndim == 0:
+                return element(md.row(0), nmd.row(0))
+            arr = np.empty(x.size, dtype=object)
+            for i in range(x.size):
+                arr[i] = element(md.row(i), nmd.row(i))
+            return arr.reshape(x.shape)
+
+        if x.ndim == 0:
+            return element(md, nmd)
+
+        md = md.reshape((x.size,) + md.shape[x.ndim:])
+        nmd = nmd.reshape((x.size,) + nmd.shape[x.ndim:])
+        arr = np.empty(x.size, dtype=object)
+        for i in range(x.size):
+            arr[i] = element(md[i], nmd[i])
+        return arr.reshape(x.shape)
+
+
+class ColumnView(Function):
+    """
+        Apply an indexing-only numpy function (slicing, reshape, transpose, ...)
+        to the element axes of a columnar Fuzzarray. The function receives an
+        ndarray of shape 'x.shape'. Returns a columnar Fuzzarray, or a Fuzznum
+        when a single element is selected.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def function(self, x):
+        from .fuzzarray import RAGGED
+        md, nmd = x.columns
+        if x.mtype in RAGGED:
+            index = np.asarray(self.func(np.arange(x.size).reshape(x.shape)))
+            if index.ndim == 0:
+                return FuzzElement(x.qrung, x.mtype)(md.row(index), nmd.row(index))
+            m, n = md.take(index), nmd.take(index)
+        else:
+            tail = md.ndim - x.ndim
+            if tail == 0:
+                m, n = np.asarray(self.func(md)), np.asarray(self.func(nmd))
+            else:
+                index = self.func(np.arange(x.size).reshape(x.shape))
+                m = md.reshape((x.size,) + md.shape[x.ndim:])[index]
+                n = nmd.reshape((x.size,) + nmd.shape[x.ndim:])[index]
+
+            if m.ndim == tail:
+                return FuzzElement(x.qrung, x.mtype)(m, n)
+        newset = Fuzzarray(x.qrung)
+        newset.mtype = x.mtype
+        newset.columns = (m, n)
+        return newset
+
+
 class FuzzValidity(Function):
     def function(self, x):
         if isinstance(x, Fuzznum):
@@ -200,7 +325,7 @@ class FuzzInitial(Function):
         if isinstance(x, Fuzzarray):
             if x.qrung is not None:
                 return False
-            if x.array.size != 0:
+            if x.size != 0:
                 return False
             return True
 
@@ -277,6 +402,8 @@ class FuzzTranspose(Function):
         if isinstance(x, Fuzznum):
             return copy.copy(x)
         if isinstance(x, Fuzzarray):
+            if x.columnar:
+                return ColumnView(np.transpose)(x)
             st = x.array
             s = st.T
 
@@ -382,6 +509,8 @@ class FuzzReshape(Function):
             newset.array = np.reshape(x, *self.shape)
             return newset
         if isinstance(x, Fuzzarray):
+            if x.columnar:
+                return ColumnView(lambda a: a.reshape(*self.shape))(x)
             newset = Fuzzarray(x.qrung)
             newset.array = x.array.reshape(*self.shape)
             return newset
@@ -396,6 +525,8 @@ class FuzzSqueeze(Function):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
+            if x.columnar:
+                return ColumnView(lambda a: np.squeeze(a, self.axis))(x)
             newset = Fuzzarray(x.qrung)
             newset.array = np.squeeze(x.array, self.axis)
             return newset
@@ -412,6 +543,8 @@ class FuzzBroadcast(Function):
             newset.array = np.broadcast_to(x, self.shape)
             return newset
         if isinstance(x, Fuzzarray):
+            if x.columnar:
+                return ColumnView(lambda a: np.broadcast_to(a, self.shape))(x)
             newset = Fuzzarray(x.qrung)
             newset.array = np.broadcast_to(x.array, self.shape)
             return newset
@@ -437,6 +570,8 @@ class FuzzRavel(Function):
             newset.array = np.ravel(x)
             return newset
         if isinstance(x, Fuzzarray):
+            if x.columnar:
+                return ColumnView(np.ravel)(x)
             newset = Fuzzarray(x.qrung)
             newset.array = np.ravel(x.array)
             return newset
@@ -449,6 +584,8 @@ class FuzzFlatten(Function):
             newset.array = np.array([x])
             return newset
         if isinstance(x, Fuzzarray):
+            if x.columnar:
+                return ColumnView(lambda a: a.flatten())(x)
             newset = Fuzzarray(x.qrung)
             newset.array = x.array.flatten()
             return newset
@@ -465,18 +602,14 @@ class FuzzGetMax(Function):
             return x
         if isinstance(x, Fuzzarray):
             if self.axis is None:
-                index = np.unravel_index(np.argmax(x.array), x.shape)
+                index = np.unravel_index(FuzzArgmax(None)(x), x.shape)
                 if self.show:
                     print(index)
-                return x.array[index]
+                return x[index]
             else:
-                m = np.max(x.array, axis=self.axis)
-                if isinstance(m, Fuzznum):
-                    return m
-                if isinstance(m, np.ndarray):
-                    newset = Fuzzarray(x.qrung)
-                    newset.array = m
-                    return newset
+                index = np.expand_dims(FuzzArgmax(self.axis)(x), self.axis)
+                m = FuzzTakeAlong(index, self.axis)(x)
+                return FuzzSqueeze(self.axis)(m) if m.ndim > 1 else m[0]
 
 
 class FuzzGetMin(Function):
@@ -490,18 +623,14 @@ class FuzzGetMin(Function):
             return x
         if isinstance(x, Fuzzarray):
             if self.axis is None:
-                index = np.unravel_index(np.argmin(x.array), x.shape)
+                index = np.unravel_index(FuzzArgmin(None)(x), x.shape)
                 if self.show:
                     print(index)
-                return x.array[index]
+                return x[index]
             else:
-                m = np.min(x.array, axis=self.axis)
-                if isinstance(m, Fuzznum):
-                    return m
-                if isinstance(m, np.ndarray):
-                    newset = Fuzzarray(x.qrung)
-                    newset.array = m
-                    return newset
+                index = np.expand_dims(FuzzArgmin(self.axis)(x), self.axis)
+                m = FuzzTakeAlong(index, self.axis)(x)
+                return FuzzSqueeze(self.axis)(m) if m.ndim > 1 else m[0]
 
 
 class FuzzGetFmax(Function):
@@ -566,6 +695,293 @@ class FuzzGetFmin(Function):
                     return newset
 
 
+def sortkeys(x):
+    """
+        The ranking keys of a Fuzzarray: score, then accuracy to break ties.
+        Elements without a score (empty hesitant elements) rank lowest.
+    """
+    score, acc = x.score, x.acc
+    score[np.isnan(score)] = -np.inf
+    acc[np.isnan(acc)] = -np.inf
+    return score, acc
+
+
+class FuzzTakeAlong(Function):
+    """
+        np.take_along_axis for a Fuzzarray. 'axis=None' takes from the
+        flattened array.
+    """
+
+    def __init__(self, index, axis):
+        self.index = index
+        self.axis = axis
+
+    def function(self, x):
+        if x.columnar:
+            return ColumnView(lambda a: np.take_along_axis(
+                a.ravel() if self.axis is None else a, self.index, -1 if self.axis is None else self.axis))(x)
+        newset = Fuzzarray(x.qrung)
+        arr = x.array.ravel() if self.axis is None else x.array
+        newset.array = np.take_along_axis(arr, self.index, -1 if self.axis is None else self.axis)
+        return newset
+
+
+class FuzzArgmax(Function):
+    """
+        Indices of the elements with the largest score along an axis, ties are
+        broken by the larger accuracy and then by the first occurrence. With
+        'axis=None' the index into the flattened array is returned.
+    """
+
+    def __init__(self, axis):
+        self.axis = axis
+
+    def function(self, x):
+        from .outofcore import ondisk, argbest
+        if x.columnar and x.ndim > 0 and ondisk(*x.columns):
+            return argbest(lambda s: sortkeys(x[s]), x.shape, self.axis, True)
+        score, acc = sortkeys(x)
+        if self.axis is None:
+            score, acc = score.ravel(), acc.ravel()
+        axis = -1 if self.axis is None else self.axis
+        best = score == np.max(score, axis=axis, keepdims=True)
+        return np.argmax(np.where(best, acc, -np.inf), axis=axis)
+
+
+class FuzzArgmin(Function):
+    """
+        Indices of the elements with the smallest score along an axis, ties are
+        broken by the smaller accuracy and then by the first occurrence.
+    """
+
+    def __init__(self, axis):
+        self.axis = axis
+
+    def function(self, x):
+        from .outofcore import ondisk, argbest
+        if x.columnar and x.ndim > 0 and ondisk(*x.columns):
+            return argbest(lambda s: sortkeys(x[s]), x.shape, self.axis, False)
+        score, acc = sortkeys(x)
+        if self.axis is None:
+            score, acc = score.ravel(), acc.ravel()
+        axis = -1 if self.axis is None else self.axis
+        best = score == np.min(score, axis=axis, keepdims=True)
+        return np.argmin(np.where(best, acc, np.inf), axis=axis)
+
+
+class FuzzArgsort(Function):
+    """
+        Indices that sort a Fuzzarray along an axis by score, then accuracy.
+        The sort is stable. 'axis=None' sorts the flattened array.
+    """
+
+    def __init__(self, axis=-1, descending=False):
+        self.axis = axis
+        self.descending = descending
+
+    def function(self, x):
+        score, acc = sortkeys(x)
+        if self.axis is None:
+            score, acc = score.ravel(), acc.ravel()
+        axis = -1 if self.axis is None else self.axis
+        if self.descending:
+            score, acc = -score, -acc
+        return np.lexsort((acc, score), axis=axis)
+
+
+class FuzzSort(Function):
+    """
+        A sorted copy of a Fuzzarray, see FuzzArgsort.
+    """
+
+    def __init__(self, axis=-1, descending=False):
+        self.axis = axis
+        self.descending = descending
+
+    def function(self, x):
+        index = FuzzArgsort(self.axis, self.descending)(x)
+        return FuzzTakeAlong(index, self.axis)(x)
+
+
+class FuzzArgpartition(Function):
+    """
+        Indices that partition a Fuzzarray along an axis around the kth element
+        in the (score, accuracy) order: the kth element is where it would be in
+        a sorted array, the elements before it are not larger and the elements
+        after it are not smaller.
+
+        The array is partitioned by score with np.argpartition, then a stable
+        radix sort on the three classes 'below, equal to, above the kth score'
+        gathers the score ties into one block, which alone is sorted by
+        accuracy. This keeps the cost linear unless many scores are tied.
+    """
+
+    def __init__(self, kth, axis=-1, descending=False):
+        self.kth = kth
+        self.axis = axis
+        self.descending = descending
+
+    def function(self, x):
+        score, acc = sortkeys(x)
+        if self.axis is None:
+            score, acc = score.ravel(), acc.ravel()
+        axis = -1 if self.axis is None else self.axis
+        if self.descending:
+            score, acc = -score, -acc
+        score, acc = np.moveaxis(score, axis, -1), np.moveaxis(acc, axis, -1)
+        shape, n = score.shape, score.shape[-1]
+        kth = self.kth + n if self.kth < 0 else self.kth
+        assert 0 <= kth < n, f'kth(={self.kth}) out of bounds ({n}).'
+        score, acc = score.reshape(-1, n), acc.reshape(-1, n)
+
+        p = np.argpartition(score, kth, axis=-1)
+        pivot = np.take_along_axis(score, p[:, kth:kth + 1], axis=-1)
+        side = (score > pivot).astype(np.int8) - (score < pivot).astype(np.int8)
+        order = np.argsort(side, axis=-1, kind='stable')
+
+        # 得分相同的元素构成连续区块，仅对该区块按精确度排序
+        lo = np.sum(side < 0, axis=-1)
+        cnt = np.sum(side == 0, axis=-1)
+        j = np.arange(cnt.max())
+        valid = j < cnt[:, None]
+        pos = np.where(valid, lo[:, None] + j, 0)
+        block = np.take_along_axis(order, pos, axis=-1)
+        key = np.where(valid, np.take_along_axis(acc, block, axis=-1), np.inf)
+        block = np.take_along_axis(block, np.argsort(key, axis=-1, kind='stable'), axis=-1)
+        rows = np.broadcast_to(np.arange(len(order))[:, None], pos.shape)
+        order[rows[valid], pos[valid]] = block[valid]
+
+        return np.moveaxis(order.reshape(shape), -1, axis)
+
+
+class FuzzTopk(Function):
+    """
+        The k largest elements of a Fuzzarray along an axis in descending
+        (score, accuracy) order, and their indices. Only the k selected
+        elements are sorted.
+    """
+
+    def __init__(self, k, axis=-1):
+        self.k = k
+        self.axis = axis
+
+    def function(self, x):
+        n = x.size if self.axis is None else x.shape[self.axis]
+        assert 0 < self.k <= n, f'k(={self.k}) must be in [1, {n}].'
+        axis = -1 if self.axis is None else self.axis
+
+        index = FuzzArgpartition(self.k - 1, self.axis, descending=True)(x)
+        index = np.take(index, np.arange(self.k), axis=axis)
+        score, acc = sortkeys(x)
+        if self.axis is None:
+            score, acc = score.ravel(), acc.ravel()
+        order = np.lexsort((-np.take_along_axis(acc, index, axis=axis),
+                            -np.take_along_axis(score, index, axis=axis)), axis=axis)
+        index = np.take_along_axis(index, order, axis=axis)
+        return FuzzTakeAlong(index, self.axis)(x), index
+
+
+class FuzzReduce(Function):
+    """
+        Closed-form sum, product or mean of a Fuzzarray along axes, computed on
+        the whole membership and non-membership arrays with the n-ary norms in
+        reductionDict[Config.arch]. Returns a Fuzznum when every axis is reduced
+        without keepdims, otherwise a columnar Fuzzarray.
+    """
+
+    def __init__(self, op, axis=None, keepdims=False, mean=False):
+        self.op = op
+        self.axis = axis
+        self.keepdims = keepdims
+        self.mean = mean
+
+    @staticmethod
+    def supported(op, x):
+        from .operationLib import reductionDict
+        return x.size > 0 and Config.arch in reductionDict and \
+            x.mtype in reductionDict[Config.arch][op]
+
+    def function(self, x):
+        from .fuzzarray import COLUMN_NDIM
+        from .operationLib import reductionDict
+        from .outofcore import ondisk, reduce
+        if self.axis is None:
+            axis = tuple(range(x.ndim))
+        else:
+            axis = (self.axis,) if np.ndim(self.axis) == 0 else tuple(self.axis)
+            for a in axis:
+                assert -x.ndim <= a < x.ndim, \
+                    f'axis {a} is out of bounds for array of dimension {x.ndim}.'
+            axis = tuple(sorted(a % x.ndim for a in axis))
+            assert len(set(axis)) == len(axis), f'duplicate value in axis: {self.axis}.'
+
+        w = None
+        if self.mean:
+            w = 1. / np.prod([x.shape[a] for a in axis], dtype=np.float64)
+
+        md, nmd = x.columns
+        kernel = reductionDict[Config.arch][self.op][x.mtype]
+        if x.ndim > 0 and ondisk(md, nmd):
+            from .operationLib.reduction import norms
+            pair = ('snorm', 'tnorm') if self.op == 'sum' else ('tnorm', 'snorm')
+            md, nmd = reduce(kernel, [norms[Config.arch][n] for n in pair],
+                             md, nmd, x.qrung, axis, self.keepdims, w)
+        else:
+            md, nmd = kernel(md, nmd, x.qrung, axis, self.keepdims, w)
+
+        if md.ndim == COLUMN_NDIM[x.mtype]:
+            return FuzzElement(x.qrung, x.mtype)(md, nmd)
+        newset = Fuzzarray(x.qrung)
+        newset.mtype = x.mtype
+        newset.columns = (md, nmd)
+        return newset
+
+
+class FuzzChoquet(Function):
+    """
+        Choquet integral aggregation of a Fuzzarray along its last axis, the
+        n criteria, under a fuzzy measure given as its 2^n values in bitmask
+        order (criterion i is bit i).
+
+        The criteria of every row are ordered by the score in ascending order
+        and the measures of the chains A_(i) = {(i), ..., (n)} give the weights
+        μ(A_(i)) - μ(A_(i+1)). The row is then aggregated by the weighted n-ary
+        sum of reductionDict[Config.arch], which is the q-ROF Choquet averaging
+        operator for the algebraic and the Einstein operations. Returns a
+        Fuzznum for one row, otherwise a columnar Fuzzarray of the rows.
+    """
+
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64).ravel()
+
+    def function(self, x):
+        from .fuzzarray import COLUMN_NDIM
+        assert x.ndim > 0, 'The fuzzy array must have at least one axis.'
+        assert FuzzReduce.supported('sum', x), \
+            f'Choquet aggregation does not support mtype \'{x.mtype}\' with {Config.arch} operations.'
+        n = x.shape[-1]
+        assert self.values.size == 1 << n, \
+            f'The measure must have 2^{n} values: {self.values.size}.'
+
+        order = np.argsort(x.score, axis=-1, kind='stable')
+        # 从得分最大的准则开始累积位掩码，得到 A_(i)
+        masks = np.cumsum((1 << order)[..., ::-1], axis=-1)[..., ::-1]
+        mu = self.values[masks]
+        w = np.empty(x.shape)
+        np.put_along_axis(w, order, mu - np.concatenate((mu[..., 1:], np.zeros(x.shape[:-1] + (1,))), axis=-1), axis=-1)
+        w = w.reshape(x.shape + (1,) * COLUMN_NDIM[x.mtype])
+
+        from .operationLib import reductionDict
+        md, nmd = x.columns
+        md, nmd = reductionDict[Config.arch]['sum'][x.mtype](md, nmd, x.qrung, (x.ndim - 1,), False, w)
+        if md.ndim == COLUMN_NDIM[x.mtype]:
+            return FuzzElement(x.qrung, x.mtype)(md, nmd)
+        newset = Fuzzarray(x.qrung)
+        newset.mtype = x.mtype
+        newset.columns = (md, nmd)
+        return newset
+
+
 class FuzzGetSum(Function):
 
     def __init__(self, axis, keepdims):
@@ -576,6 +992,8 @@ class FuzzGetSum(Function):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
+            if FuzzReduce.supported('sum', x):
+                return FuzzReduce('sum', self.axis, self.keepdims)(x)
             if self.axis is None:
                 return np.sum(x.array)
             else:
@@ -598,6 +1016,8 @@ class FuzzGetProd(Function):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
+            if FuzzReduce.supported('prod', x):
+                return FuzzReduce('prod', self.axis, self.keepdims)(x)
             if self.axis is None:
                 return np.prod(x.array)
             else:
@@ -619,6 +1039,8 @@ class FuzzMean(Function):
         if isinstance(x, Fuzznum):
             return x
         if isinstance(x, Fuzzarray):
+            if FuzzReduce.supported('sum', x):
+                return FuzzReduce('sum', self.axis, mean=True)(x)
             if self.axis is None:
                 return np.mean(x.array)
             else:
@@ -631,6 +1053,47 @@ class FuzzMean(Function):
                     return newset
 
 
+class HesitantDegrees:
+    """
+        The degrees of a RaggedArray of hesitant elements sorted in descending
+        order, padded with -inf to an array of shape 'shape + (K,)', with the
+        value t * max + (1 - t) * min that extends an element in the
+        normalization and its position in the sorted degrees.
+    """
+
+    def __init__(self, r, t):
+        self.lengths = r.lengths
+        assert np.all(self.lengths > 0), "the two q-rohfns must be not empty."
+        self.sorted = -np.sort(-r.dense(-np.inf), axis=-1)
+        low = np.take_along_axis(self.sorted, self.lengths[..., None] - 1, axis=-1)[..., 0]
+        self.pad = t * self.sorted[..., 0] + (1. - t) * low
+        # 补齐的值在降序序列中的插入位置
+        self.split = np.sum(self.sorted > self.pad[..., None], axis=-1)
+
+    def extend(self, n, rows=None):
+        """
+            The elements extended to n degrees and sorted in descending order,
+            as an array of shape 'shape + (n.max(),)' with nan after the first
+            n degrees of every element. n is broadcast against the elements
+            (or against the flat elements 'rows' when they are given) and
+            must not be below their lengths.
+        """
+        lengths, split, pad, d = self.lengths, self.split, self.pad, self.sorted
+        if rows is not None:
+            lengths, split, pad = lengths.ravel()[rows], split.ravel()[rows], pad.ravel()[rows]
+            d = d.reshape(-1, d.shape[-1])[rows]
+        n = np.asarray(n)
+        shape = np.broadcast_shapes(n.shape, lengths.shape)
+        x = np.arange(int(n.max()) if n.size else 0)
+        n, pad, split = [np.broadcast_to(a, shape)[..., None] for a in (n, pad, split)]
+        fill = n - np.broadcast_to(lengths, shape)[..., None]
+        # 插入位置之后的原有值整体后移 fill 位
+        src = np.clip(np.where(x < split, x, x - fill), 0, d.shape[-1] - 1)
+        d = np.take_along_axis(np.broadcast_to(d, shape + d.shape[-1:]), src, axis=-1)
+        d = np.where((x >= split) & (x < split + fill), pad, d)
+        return np.where(x < n, d, np.nan)
+
+
 class FuzzNormalize(Function):
 
     def __init__(self, tao):
@@ -643,11 +1106,18 @@ class FuzzNormalize(Function):
                 the interval [0, 1]. 't=1' indicates optimistic normalization and
                 't=0' indicates pessimistic normalization.
 
+            For two fuzzy numbers it returns the two normalized fuzzy numbers. When
+            either is a fuzzy array, the pairs of elements of the broadcast shape are
+            normalized at once and it returns the dense degrees ((md1, nmd1), (md2, nmd2)),
+            arrays of shape 'shape + (K,)' sorted in descending order. Each pair is
+            extended to the larger of its two lengths and the remaining K - n degrees
+            are nan, so nansum and nanmean reduce over the normalized degrees.
+
             Parameters
             ----------
-                d1 : Fuzznum
+                d1 : Fuzznum or Fuzzarray
                     The first q-rung orthopair hesitant fuzzy number
-                d2 : Fuzznum
+                d2 : Fuzznum or Fuzzarray
                     The second q-rung orthopair hesitant fuzzy number
 
             References
@@ -657,50 +1127,38 @@ class FuzzNormalize(Function):
                 Inform Sciences, vol. 607, pp. 1532–1549, 2022, doi: 10.1016/j.ins.2022.06.037.
         """
         if d1.mtype == d2.mtype == 'qrohfn':
-            def __adj(d, tm):
-                return tm * d.max() + (1. - tm) * d.min()
-
-            d_1 = copy.deepcopy(d1)
-            d_2 = copy.deepcopy(d2)
-
-            md_len = len(d_1.md) - len(d_2.md)
-            nmd_len = len(d_1.nmd) - len(d_2.nmd)
-
-            if md_len > 0:
-                # Explain that the number of membership elements in d1 is greater than d2,
-                # and it is necessary to add elements of d2 membership.
-                i = 0.
-                m = d_2.md
-                while i < md_len:
-                    d_2.md = np.append(d_2.md, __adj(m, self.tao))
-                    i += 1
-            else:
-                # Explain that the number of membership elements in d1 is less than d2,
-                # and it is necessary to increase the elements of d1 membership.
-                i = 0.
-                m = d_1.md
-                while i < (-md_len):
-                    d_1.md = np.append(d_1.md, __adj(m, self.tao))
-                    i += 1
-
-            if nmd_len > 0:
-                # Explain that the number of membership elements in d1 is greater than d2,
-                # and it is necessary to add elements of d2 membership.
-                i = 0.
-                u = d_2.nmd
-                while i < nmd_len:
-                    d_2.nmd = np.append(d_2.nmd, __adj(u, self.tao))
-                    i += 1
-            else:
-                i = 0.
-                u = d_1.nmd
-                while i < (-nmd_len):
-                    d_1.nmd = np.append(d_1.nmd, __adj(u, self.tao))
-                    i += 1
-            return d_1.qsort(), d_2.qsort()
+            if isinstance(d1, Fuzznum) and isinstance(d2, Fuzznum):
+                md = max(len(d1.md), len(d2.md))
+                nmd = max(len(d1.nmd), len(d2.nmd))
+                return FuzzElement(d1.qrung, d1.mtype)(self.__extend(d1.md, md), self.__extend(d1.nmd, nmd)), \
+                    FuzzElement(d2.qrung, d2.mtype)(self.__extend(d2.md, md), self.__extend(d2.nmd, nmd))
+            (m1, n1), (m2, n2) = self.__columns(d1), self.__columns(d2)
+            md_1, md_2 = self.__pair(m1, m2)
+            nmd_1, nmd_2 = self.__pair(n1, n2)
+            return (md_1, nmd_1), (md_2, nmd_2)
         else:
             raise TypeError(f'Unsupported fuzzy type, {d1.mtype} and {d2.mtype}')
 
+    def __extend(self, d, n):
+        d = np.asarray(d, dtype=np.float64)
+        if d.size < n:
+            adj = self.tao * d.max() + (1. - self.tao) * d.min()
+            d = np.concatenate((d, np.full(n - d.size, adj)))
+        return np.abs(np.sort(-d))
+
+    @staticmethod
+    def __columns(x):
+        from .ragged import RaggedArray
+        if isinstance(x, Fuzznum):
+            md, nmd = np.asarray(x.md, dtype=np.float64), np.asarray(x.nmd, dtype=np.float64)
+            return RaggedArray(md, [0, md.size], ()), RaggedArray(nmd, [0, nmd.size], ())
+        return x.columns
+
+    def __pair(self, r1, r2):
+        h1, h2 = HesitantDegrees(r1, self.tao), HesitantDegrees(r2, self.tao)
+        n = np.maximum(h1.lengths, h2.lengths)
+        return h1.extend(n), h2.extend(n)
+
 
 # TODO：待实现
 class FuzzAbsolute(Function):
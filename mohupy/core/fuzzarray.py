@@ -9,30 +9,92 @@ import numpy as np
 
 from .base import MohuBase
 
+# Number of trailing axes an element occupies in the columnar (struct-of-arrays)
+# storage: a q-rofn element is a single float, an ivfn element is a (lower, upper) pair.
+COLUMN_NDIM = {'qrofn': 0, 'ivfn': 1}
+
+# Elements of these mtypes hold a variable number of degrees, their columnar storage
+# is a pair of RaggedArray (one flat values buffer plus row offsets each).
+RAGGED = ('qrohfn',)
+
 
 class Fuzzarray(MohuBase):
+    """
+        Fuzzy array.
+
+        A Fuzzarray has two storage modes. By default, every element is a separate
+        Fuzznum held in an object ndarray (see 'array'). In columnar mode, the
+        membership and non-membership degrees are held in two contiguous float64
+        ndarrays of shape 'shape + element shape' (see 'columns'), and Fuzznum
+        objects are only created when a single element is indexed. Columnar storage
+        is supported for 'qrofn' and 'ivfn'. For 'qrohfn' the columns are two
+        RaggedArray, as every element holds a variable number of degrees.
+    """
     __array_priority__ = 200
     __array = np.array([], dtype=object)
+    __md = None
+    __nmd = None
+    __cache = None
 
     def __init__(self, qrung=None):
         super().__init__()
         self.ndim = 0
         self.size = 0
         self.shape = ()
+        self.__cache = {}
 
         from .funcitonClass import InitializeSet
         self.qrung, self.mtype = InitializeSet()(qrung)
 
     def __len__(self):
+        if self.columnar:
+            if self.ndim == 0:
+                raise TypeError('len() of unsized object')
+            return self.shape[0]
         return len(self.__array)
 
+    def __cached(self, name, func):
+        """
+            Derived arrays (score, acc, ind) are cached per qrung in columnar
+            mode, whose columns are read-only and only change when they are set
+            again. A copy is returned so that the cache cannot be modified through
+            the result. In object mode the elements can be changed in place, so
+            the arrays are computed on every access.
+        """
+        if not self.columnar:
+            return func(self)
+        key = (name, self.qrung)
+        if key not in self.__cache:
+            self.__cache[key] = func(self)
+        value = self.__cache[key]
+        return value.copy() if isinstance(value, np.ndarray) else value
+
+    @property
+    def columnar(self) -> bool:
+        """
+            Whether the fuzzy array is stored as membership and non-membership
+            float arrays instead of an object array of Fuzznum.
+        """
+        return self.__md is not None
+
     @property
     def array(self):
+        """
+            The object ndarray of Fuzznum. In columnar mode the object array is
+            built on demand from the columns, so writing into it does not change
+            the fuzzy array.
+        """
+        if self.columnar:
+            from .funcitonClass import FuzzMaterialize
+            return FuzzMaterialize()(self)
         return self.__array
 
     @array.setter
     def array(self, value: np.ndarray):
         from .fuzznums import Fuzznum
+        self.__md = None
+        self.__nmd = None
+        self.__cache = {}
         if value.size == 0:
             self.__array = np.array([], dtype=object)
             self.ndim = value.ndim
@@ -46,72 +108,102 @@ class Fuzzarray(MohuBase):
             self.qrung = value.qrung
             self.mtype = value.mtype
         elif all(isinstance(x, Fuzznum) for x in value.flat):
-            try:
-                self.__array = value
-                self.ndim = value.ndim
-                self.size = value.size
-                self.shape = value.shape
-
-                flatten = value.flatten()
-                e = np.random.choice(flatten)
-
-                self.qrung = e.qrung
-                self.mtype = e.mtype
-            except ValueError as e:
-                raise ValueError(f'Setup failed: {e}')
+            self.__array = value
+            self.ndim = value.ndim
+            self.size = value.size
+            self.shape = value.shape
+
+            e = value.flat[0]
+            self.qrung = e.qrung
+            self.mtype = e.mtype
         else:
             raise TypeError(f"Invalid fuzzy type.")
 
+    @property
+    def columns(self):
+        """
+            The membership and non-membership degrees as a tuple of two float64
+            ndarrays of shape 'shape + element shape', or of two RaggedArray of
+            shape 'shape' for hesitant mtypes. In columnar mode the stored
+            arrays are returned as read-only views, otherwise they are gathered
+            from the Fuzznum elements.
+        """
+        if self.columnar:
+            return self.__md, self.__nmd
+        from .funcitonClass import FuzzColumns
+        return FuzzColumns()(self)
+
+    @columns.setter
+    def columns(self, value):
+        assert self.mtype in COLUMN_NDIM or self.mtype in RAGGED, \
+            f'Columnar storage does not support mtype: {self.mtype}.'
+        assert self.qrung is not None, \
+            'The qrung of a columnar fuzzy array must be set.'
+        md, nmd = value
+        if self.mtype in RAGGED:
+            from .ragged import RaggedArray
+            assert isinstance(md, RaggedArray) and isinstance(nmd, RaggedArray), \
+                f'The columns of mtype \'{self.mtype}\' must be RaggedArray.'
+            assert md.shape == nmd.shape, \
+                f'The shapes of md and nmd do not match: {md.shape} and {nmd.shape}.'
+            shape = md.shape
+        else:
+            md = np.asarray(md, dtype=np.float64)
+            nmd = np.asarray(nmd, dtype=np.float64)
+            assert md.shape == nmd.shape, \
+                f'The shapes of md and nmd do not match: {md.shape} and {nmd.shape}.'
+            tail = COLUMN_NDIM[self.mtype]
+            assert md.ndim >= tail and md.shape[md.ndim - tail:] == (2,) * tail, \
+                f'Invalid element shape for mtype \'{self.mtype}\': {md.shape}.'
+
+            md, nmd = md.view(), nmd.view()
+            md.flags.writeable = False
+            nmd.flags.writeable = False
+            shape = md.shape[:md.ndim - tail]
+
+        self.__array = np.array([], dtype=object)
+        self.__md = md
+        self.__nmd = nmd
+        self.__cache = {}
+        self.shape = shape
+        self.ndim = len(self.shape)
+        self.size = int(np.prod(self.shape, dtype=np.int64))
+
     @property
     def score(self):
         from .attributeClass import Score
-        vec_func = np.vectorize(Score())
-        return vec_func(self.__array)
+        return self.__cached('score', Score())
 
     @property
     def acc(self):
         from .attributeClass import Accuracy
-        vec_func = np.vectorize(Accuracy())
-        return vec_func(self.__array)
+        return self.__cached('acc', Accuracy())
 
     @property
     def ind(self):
         from .attributeClass import Indeterminacy
-        vec_func = np.vectorize(Indeterminacy())
-        return vec_func(self.__array)
+        return self.__cached('ind', Indeterminacy())
 
     @property
     def comp(self) -> 'Fuzzarray':
         from .attributeClass import Complement
         vec_func = np.vectorize(Complement())
         newset = Fuzzarray(self.qrung)
-        newset.array = vec_func(self.__array)
+        newset.array = vec_func(self.array)
         return newset
 
     @property
     def md(self):
-        if self.__array.size != 0:
-            def membership(t):
-                if isinstance(t.md, (int, float, np.float64, np.int_)):
-                    return np.float64(t.md)
-                if isinstance(t.md, (np.ndarray, list)):
-                    return np.array(t.md, dtype=object)
-
-            vec_func = np.vectorize(membership)
-            return vec_func(self.__array)
+        if self.columnar or self.__array.size != 0:
+            from .attributeClass import Membership
+            return Membership()(self)
         return None
 
     @property
     def nmd(self):
-        if self.__array.size != 0:
-            def membership(t):
-                if isinstance(t.nmd, (int, float, np.float64, np.int_)):
-                    return np.float64(t.nmd)
-                if isinstance(t.nmd, (np.ndarray, list)):
-                    return np.array(t.nmd, dtype=object)
-
-            vec_func = np.vectorize(membership)
-            return vec_func(self.__array)
+        if self.columnar or self.__array.size != 0:
+            from .attributeClass import NonMembership
+            return NonMembership()(self)
         return None
 
     @property
@@ -183,6 +275,30 @@ class Fuzzarray(MohuBase):
         from .funcitonClass import FuzzMean
         return FuzzMean(axis)(self)
 
+    def argmax(self, axis=None):
+        from .funcitonClass import FuzzArgmax
+        return FuzzArgmax(axis)(self)
+
+    def argmin(self, axis=None):
+        from .funcitonClass import FuzzArgmin
+        return FuzzArgmin(axis)(self)
+
+    def argsort(self, axis=-1, descending=False):
+        from .funcitonClass import FuzzArgsort
+        return FuzzArgsort(axis, descending)(self)
+
+    def sort(self, axis=-1, descending=False):
+        from .funcitonClass import FuzzSort
+        return FuzzSort(axis, descending)(self)
+
+    def argpartition(self, kth, axis=-1):
+        from .funcitonClass import FuzzArgpartition
+        return FuzzArgpartition(kth, axis)(self)
+
+    def topk(self, k, axis=-1):
+        from .funcitonClass import FuzzTopk
+        return FuzzTopk(k, axis)(self)
+
     def fmax(self, func, *params, show=False, axis=None):
         from .funcitonClass import FuzzGetFmax
         return FuzzGetFmax(show, axis, func, *params)(self)
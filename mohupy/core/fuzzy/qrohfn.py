@@ -156,44 +156,5 @@ class qROHFN(Template):
 
     @staticmethod
     def normalize(d1, d2, tao):
-        def __adj(d, tm):
-            return tm * d.max() + (1. - tm) * d.min()
-
-        d_1 = copy.deepcopy(d1)
-        d_2 = copy.deepcopy(d2)
-
-        md_len = len(d_1.md) - len(d_2.md)
-        nmd_len = len(d_1.nmd) - len(d_2.nmd)
-
-        if md_len > 0:
-            # Explain that the number of membership elements in d1 is greater than d2,
-            # and it is necessary to add elements of d2 membership.
-            i = 0.
-            m = d_2.md
-            while i < md_len:
-                d_2.md = np.append(d_2.md, __adj(m, tao))
-                i += 1
-        else:
-            # Explain that the number of membership elements in d1 is less than d2,
-            # and it is necessary to increase the elements of d1 membership.
-            i = 0.
-            m = d_1.md
-            while i < (-md_len):
-                d_1.md = np.append(d_1.md, __adj(m, tao))
-                i += 1
-
-        if nmd_len > 0:
-            # Explain that the number of membership elements in d1 is greater than d2,
-            # and it is necessary to add elements of d2 membership.
-            i = 0.
-            u = d_2.nmd
-            while i < nmd_len:
-                d_2.nmd = np.append(d_2.nmd, __adj(u, tao))
-                i += 1
-        else:
-            i = 0.
-            u = d_1.nmd
-            while i < (-nmd_len):
-                d_1.nmd = np.append(d_1.nmd, __adj(u, tao))
-                i += 1
-        return d_1.qsort(), d_2.qsort()
+        from ..funcitonClass import FuzzNormalize
+        return FuzzNormalize(tao)(d1, d2)
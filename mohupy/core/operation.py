@@ -10,7 +10,34 @@ import numpy as np
 from .base import Operation
 from .fuzznums import Fuzznum
 from .fuzzarray import Fuzzarray
-from .operationClass import BasicOperation
+from .operationClass import BasicOperation, ArrayOperation
+
+
+def bulk(*xs):
+    """
+        Whether an operation on these operands can run on whole membership and
+        non-membership arrays instead of element by element: at least one operand
+        is a Fuzzarray and every fuzzy operand has a columnar mtype.
+    """
+    from .fuzzarray import COLUMN_NDIM, RAGGED
+    fuzz = [t for t in xs if isinstance(t, (Fuzznum, Fuzzarray))]
+    return any(isinstance(t, Fuzzarray) for t in fuzz) and \
+        all(t.mtype in COLUMN_NDIM or t.mtype in RAGGED for t in fuzz)
+
+
+def basic(x, y=None):
+    """
+        The BasicOperation for the per-element path, built once per operation
+        from the first fuzzy operand so the kernels are resolved only once.
+    """
+    for t in (x, y):
+        if isinstance(t, (Fuzznum, Fuzzarray)):
+            return BasicOperation(t.qrung, t.mtype)
+
+
+def _match(x0, x1):
+    assert x0.mtype == x1.mtype, f"mtype does not match('{x0.mtype}' and '{x1.mtype}')."
+    assert x0.qrung == x1.qrung, f"qrung does not match({x0.qrung} and {x1.qrung})."
 
 
 class Addition(Operation):
@@ -22,17 +49,22 @@ class Addition(Operation):
             4. 模糊集合 + 模糊集合
         """
 
+        operation = basic(x, y)
+
         def __add(x0, x1):
             assert x0.mtype == x1.mtype, f"mtype does not match('{x.mtype}' and '{x1.mtype}')."
             assert x0.qrung == x1.qrung, f"qrung does not match({x.qrung} and {x1.qrung})."
-
-            operation = BasicOperation(x0.qrung, x0.mtype)
             return operation.add(x0, x1)
 
         # 模糊数 + 模糊数
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __add(x, y)
 
+        # 集合参与运算：隶属度与非隶属度数组整体广播计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and bulk(x, y):
+            _match(x, y)
+            return ArrayOperation(x.qrung, x.mtype).add(x, y)
+
         # 模糊数 + 集合（广播）
         if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
             vec_func = np.vectorize(__add)
@@ -70,16 +102,22 @@ class Subtraction(Operation):
             4. 模糊集合 - 模糊集合
         """
 
+        operation = basic(x, y)
+
         def __sub(x0, x1):
             assert x0.mtype == x1.mtype, f"mtype does not match('{x.mtype}' and '{x1.mtype}')."
             assert x0.qrung == x1.qrung, f"qrung does not match({x.qrung} and {x1.qrung})."
-            operation = BasicOperation(x0.qrung, x0.mtype)
             return operation.sub(x0, x1)
 
         # 模糊数 - 模糊数
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
             return __sub(x, y)
 
+        # 集合参与运算：隶属度与非隶属度数组整体广播计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and bulk(x, y):
+            _match(x, y)
+            return ArrayOperation(x.qrung, x.mtype).sub(x, y)
+
         # 模糊数 - 集合（广播）
         if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
             vec_func = np.vectorize(__sub)
@@ -127,21 +165,20 @@ class Multiplication(Operation):
             12.数集合 * 模糊集合
         """
 
+        operation = basic(x, y)
+
         def __mul(x0, x1):
             if isinstance(x0, Fuzznum) and isinstance(x1, Fuzznum):
                 assert x0.mtype == x1.mtype, f"mtype does not match('{x0.mtype}' and '{x1.mtype}')."
                 assert x0.qrung == x1.qrung, f"qrung does not match({x0.qrung} and {x1.qrung})."
-                operation = BasicOperation(x0.qrung, x0.mtype)
                 return operation.mul(x0, x1)
 
             if isinstance(x0, Fuzznum) and isinstance(x1, (int, float, np.float64, np.int_)):
                 assert x1 > 0, f"value must be greater than 0: ({x1} <= 0)."
-                operation = BasicOperation(x0.qrung, x0.mtype)
                 return operation.times(x1, x0)
 
             if isinstance(x0, (int, float, np.float64, np.int_)) and isinstance(x1, Fuzznum):
                 assert x0 > 0, f"value must be greater than 0: ({x0} <= 0)."
-                operation = BasicOperation(x1.qrung, x1.mtype)
                 return operation.times(x0, x1)
 
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
@@ -150,6 +187,21 @@ class Multiplication(Operation):
         if isinstance(x, Fuzznum) and isinstance(y, (int, float, np.float64, np.int_)):
             return __mul(x, y)
 
+        # 集合参与运算：隶属度与非隶属度数组整体广播计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and bulk(x, y):
+            _match(x, y)
+            return ArrayOperation(x.qrung, x.mtype).mul(x, y)
+
+        if isinstance(x, (Fuzznum, Fuzzarray)) and \
+                isinstance(y, (int, float, np.float64, np.int_, np.ndarray)) and bulk(x, y):
+            assert np.all(y > 0), f"value must be greater than 0: ({y} <= 0)."
+            return ArrayOperation(x.qrung, x.mtype).times(y, x)
+
+        if isinstance(x, (int, float, np.float64, np.int_, np.ndarray)) and \
+                isinstance(y, (Fuzznum, Fuzzarray)) and bulk(x, y):
+            assert np.all(x > 0), f"value must be greater than 0: ({x} <= 0)."
+            return ArrayOperation(y.qrung, y.mtype).times(x, y)
+
         if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
             vec_func = np.vectorize(__mul)
             newset = Fuzzarray(x.qrung)
@@ -229,15 +281,15 @@ class Division(Operation):
             8. 模糊集合 / 数
         """
 
+        operation = basic(x, y)
+
         def __div(x0, x1):
             if isinstance(x0, Fuzznum) and isinstance(x1, Fuzznum):
                 assert x0.mtype == x1.mtype, f"mtype does not match: ('{x0.mtype}', '{x1.mtype}')."
                 assert x0.qrung == x1.qrung, f"qrung does not match: ({x0.qrung}, {x1.qrung})."
-                operation = BasicOperation(x0.qrung, x.mtype)
                 return operation.div(x0, x1)
             if isinstance(x0, Fuzznum) and isinstance(x1, (int, float, np.float64, np.int_)):
                 assert x1 > 0, f"value must be greater than 0: ({x1} <= 0)."
-                operation = BasicOperation(x0.qrung, x0.mtype)
                 return operation.times((1 / x1), x0)
 
         if isinstance(x, Fuzznum) and isinstance(y, Fuzznum):
@@ -246,6 +298,17 @@ class Division(Operation):
         if isinstance(x, Fuzznum) and isinstance(y, (int, float, np.float64, np.int_)):
             return __div(x, y)
 
+        # 集合参与运算：模糊数与模糊集合相除时，隶属度与非隶属度数组整体广播计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and isinstance(y, (Fuzznum, Fuzzarray)) and bulk(x, y):
+            _match(x, y)
+            return ArrayOperation(x.qrung, x.mtype).div(x, y)
+
+        # 集合参与运算：除以数或数集合时，隶属度与非隶属度数组整体广播计算
+        if isinstance(x, (Fuzznum, Fuzzarray)) and \
+                isinstance(y, (int, float, np.float64, np.int_, np.ndarray)) and bulk(x, y):
+            assert np.all(y > 0), f"value must be greater than 0: ({y} <= 0)."
+            return ArrayOperation(x.qrung, x.mtype).times(1 / y, x)
+
         if isinstance(x, Fuzznum) and isinstance(y, Fuzzarray):
             vec_func = np.vectorize(__div)
             newset = Fuzzarray(x.qrung)
@@ -301,14 +364,20 @@ class Power(Operation):
             4. 模糊集合 ** 数集合
         """
 
+        operation = basic(x)
+
         def __pow(x0, p):
             assert p > 0, f"value must be greater than 0: ({self.p} <= 0)."
-            operation = BasicOperation(x0.qrung, x0.mtype)
             return operation.power(p, x0)
 
         if isinstance(x, Fuzznum) and isinstance(self.p, (int, float, np.float64, np.int_)):
             return __pow(x, self.p)
 
+        # 集合参与运算：隶属度与非隶属度数组整体广播计算
+        if isinstance(self.p, (int, float, np.float64, np.int_, np.ndarray)) and bulk(x, self.p):
+            assert np.all(self.p > 0), f"value must be greater than 0: ({self.p} <= 0)."
+            return ArrayOperation(x.qrung, x.mtype).power(self.p, x)
+
         if isinstance(x, Fuzznum) and isinstance(self.p, np.ndarray):
             vec_func = np.vectorize(__pow)
             newset = Fuzzarray(x.qrung)
@@ -339,6 +408,13 @@ class MatrixMul(Operation):
         assert x.ndim > 0, f"input operand 0 does not have enough dimensions."
         assert y.ndim > 0, f"input operand 1 does not have enough dimensions."
 
+        # 矩阵乘法的和与积在 log 空间中化为矩阵乘积，整体计算
+        if bulk(x, y):
+            _match(x, y)
+            operation = ArrayOperation(x.qrung, x.mtype)
+            if operation.supports('matmul'):
+                return operation.matmul(x, y)
+
         newset = Fuzzarray(x.qrung)
         newset.array = x.array @ y.array
         return newset
@@ -601,6 +677,9 @@ class GetItem(Operation):
         self.slices = slices
 
     def function(self, x):
+        if x.columnar:
+            from .funcitonClass import ColumnView
+            return ColumnView(lambda a: a[self.slices])(x)
         from .construct import fuzzset
         y = x.array[self.slices]
         if isinstance(y, np.ndarray):
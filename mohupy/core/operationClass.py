@@ -5,72 +5,167 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
+import numpy as np
+
 from .operationLib import archimedeanDict
 
 
 class BasicOperation:
-    # norms = 'algebraic'
+    """
+        Operations on single fuzzy numbers. The archimedean norm is taken from
+        Config.arch when the operation is created, and each kernel is looked up
+        once and called once per result.
+    """
 
     def __init__(self, qrung, mtype):
+        from ..config import Config
         self.qrung = qrung
         self.mtype = mtype
+        self.__norms = archimedeanDict[Config.arch]
+        self.__kernels = {}
 
-    def add(self, x, y):
+    def __kernel(self, op):
+        if op not in self.__kernels:
+            self.__kernels[op] = self.__norms[op][self.mtype]
+        return self.__kernels[op]
+
+    def __result(self, md, nmd):
         from .fuzznums import Fuzznum
-        from ..config import Config
         newfn = Fuzznum()
         newfn.mtype = self.mtype
         newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['add'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['add'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
+        newfn.md = md
+        newfn.nmd = nmd
         return newfn
 
+    def add(self, x, y):
+        md, nmd = self.__kernel('add')(x.md, x.nmd, y.md, y.nmd, self.qrung)
+        return self.__result(md, nmd)
+
     def sub(self, x, y):
-        from .fuzznums import Fuzznum
-        from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['sub'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['sub'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
-        return newfn
+        md, nmd = self.__kernel('sub')(x.md, x.nmd, y.md, y.nmd, self.qrung)
+        return self.__result(md, nmd)
 
     def mul(self, x, y):
-        from .fuzznums import Fuzznum
-        from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['mul'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['mul'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
-        return newfn
+        md, nmd = self.__kernel('mul')(x.md, x.nmd, y.md, y.nmd, self.qrung)
+        return self.__result(md, nmd)
 
     def div(self, x, y):
-        from .fuzznums import Fuzznum
-        from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['div'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['div'][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
-        return newfn
+        md, nmd = self.__kernel('div')(x.md, x.nmd, y.md, y.nmd, self.qrung)
+        return self.__result(md, nmd)
 
     def power(self, l, x):
-        from .fuzznums import Fuzznum
+        md, nmd = self.__kernel('pow')(l, x.md, x.nmd, self.qrung)
+        return self.__result(md, nmd)
+
+    def times(self, l, x):
+        md, nmd = self.__kernel('tim')(l, x.md, x.nmd, self.qrung)
+        return self.__result(md, nmd)
+
+
+class ArrayOperation:
+    """
+        Bulk counterpart of BasicOperation. The archimedean kernel is looked up
+        once and called on the whole membership and non-membership arrays of the
+        operands with numpy broadcasting. Operands are Fuzzarray or Fuzznum, and
+        the result is a columnar Fuzzarray.
+    """
+
+    def __init__(self, qrung, mtype):
+        self.qrung = qrung
+        self.mtype = mtype
+
+    def __kernel(self, op):
         from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['pow'][self.mtype](l, x.md, x.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['pow'][self.mtype](l, x.md, x.nmd, self.qrung)[1]
-        return newfn
+        return archimedeanDict[Config.arch][op][self.mtype]
+
+    def __crisp(self, l, x):
+        """
+            Align a crisp array with the columns of x. An ivfn element occupies
+            one trailing axis; ragged columns are broadcast to the common shape.
+        """
+        from .fuzzarray import COLUMN_NDIM, RAGGED
+        md, nmd = columns(x)
+        l = np.asarray(l, dtype=np.float64)
+        if self.mtype in RAGGED:
+            shape = np.broadcast_shapes(l.shape, md.shape)
+            return l, md.broadcast_to(shape), nmd.broadcast_to(shape)
+        if l.ndim > 0:
+            l = l.reshape(l.shape + (1,) * COLUMN_NDIM[self.mtype])
+        return l, md, nmd
+
+    def __run(self, op, *args):
+        """
+            Call the kernel of 'op' on the degree arrays. When an operand is
+            memory-mapped, the kernel runs block by block (see outofcore).
+        """
+        from .fuzzarray import RAGGED
+        from .outofcore import ondisk, elementwise
+        if self.mtype not in RAGGED and ondisk(*args):
+            return elementwise(self.__kernel(op), args, self.qrung)
+        return self.__kernel(op)(*args, self.qrung)
+
+    def __result(self, md, nmd):
+        from .fuzzarray import Fuzzarray
+        newset = Fuzzarray(self.qrung)
+        newset.mtype = self.mtype
+        newset.columns = (md, nmd)
+        return newset
+
+    def add(self, x, y):
+        return self.__result(*self.__run('add', *columns(x), *columns(y)))
+
+    def sub(self, x, y):
+        return self.__result(*self.__run('sub', *columns(x), *columns(y)))
+
+    def mul(self, x, y):
+        return self.__result(*self.__run('mul', *columns(x), *columns(y)))
+
+    def div(self, x, y):
+        return self.__result(*self.__run('div', *columns(x), *columns(y)))
+
+    def power(self, l, x):
+        return self.__result(*self.__run('pow', *self.__crisp(l, x)))
 
     def times(self, l, x):
-        from .fuzznums import Fuzznum
+        return self.__result(*self.__run('tim', *self.__crisp(l, x)))
+
+    def supports(self, op):
+        """
+            Whether the current archimedean norm has a kernel of 'op' for mtype.
+        """
         from ..config import Config
-        newfn = Fuzznum()
-        newfn.mtype = self.mtype
-        newfn.qrung = self.qrung
-        newfn.md = archimedeanDict[Config.arch]['tim'][self.mtype](l, x.md, x.nmd, self.qrung)[0]
-        newfn.nmd = archimedeanDict[Config.arch]['tim'][self.mtype](l, x.md, x.nmd, self.qrung)[1]
-        return newfn
+        return self.mtype in archimedeanDict[Config.arch].get(op, {})
+
+    def matmul(self, x, y):
+        """
+            Fuzzy matrix product with the broadcasting and 1-D promotion rules
+            of numpy.matmul. A 1-D by 1-D product gives a Fuzznum.
+        """
+        from .fuzzarray import COLUMN_NDIM
+        from .funcitonClass import FuzzElement
+        tail = COLUMN_NDIM[self.mtype]
+        (x0, y0), (x1, y1) = columns(x), columns(y)
+        if x.ndim == 1:
+            x0, y0 = x0[None], y0[None]
+        if y.ndim == 1:
+            x1, y1 = x1[:, None], y1[:, None]
+
+        md, nmd = self.__kernel('matmul')(x0, y0, x1, y1, self.qrung)
+        # 去掉提升时加入的维度
+        drop = tuple(a for a, d in ((-2 - tail, x.ndim), (-1 - tail, y.ndim)) if d == 1)
+        md, nmd = np.squeeze(md, axis=drop), np.squeeze(nmd, axis=drop)
+        if md.ndim == tail:
+            return FuzzElement(self.qrung, self.mtype)(md, nmd)
+        return self.__result(md, nmd)
+
+
+def columns(x):
+    """
+        The membership and non-membership degrees of a Fuzznum or Fuzzarray as
+        float64 ndarrays (RaggedArray for a hesitant Fuzzarray).
+    """
+    from .fuzzarray import Fuzzarray
+    if isinstance(x, Fuzzarray):
+        return x.columns
+    return np.asarray(x.md, dtype=np.float64), np.asarray(x.nmd, dtype=np.float64)
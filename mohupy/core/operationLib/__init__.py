@@ -16,4 +16,16 @@ archimedeanDict['algebraic'] = {'add': algebAdd,
                                 'pow': algebPow,
                                 'tim': algebTim}
 
-__all__ += ['archimedeanDict']
\ No newline at end of file
+from .matmul import algebMatmul
+archimedeanDict['algebraic']['matmul'] = algebMatmul
+
+__all__ += ['archimedeanDict']
+reductionDict = dict()
+
+from .reduction import algebSum, algebProd, einsSum, einsProd
+reductionDict['algebraic'] = {'sum': algebSum,
+                              'prod': algebProd}
+reductionDict['einstein'] = {'sum': einsSum,
+                             'prod': einsProd}
+
+__all__ += ['reductionDict']
@@ -39,16 +39,24 @@ def algebraic_sub(x0, y0, x1, y1, q):
     :param x1:  第二个数的隶属度
     :param y1:  第二个数的非隶属度
     :param q:   Q 阶
+
+    The operands may be scalars or arrays of broadcastable shapes. Elements
+    which fall outside the domain of the subtraction (the first number is
+    the zero element, the second number is the unit element, or the
+    condition 0 <= y0/y1 <= ((1-x0^q)/(1-x1^q))^(1/q) <= 1 does not hold)
+    give (0, 1).
     """
-    if x0 == 0. and y0 == 1.:
-        return 0., 1.
-    if x1 == 1. or y1 == 0.:
-        return 0., 1.
-    if 0. <= y0 / y1 <= ((1 - x0 ** q) / (1 - x1 ** q)) ** (1 / q) <= 1.:
-        md = np.round(((x0 ** q - x1 ** q) / (1 - x1 ** q)) ** (1 / q), Approx.round)
-        nmd = np.round(y0 / y1, Approx.round)
-        return md, nmd
-    return 0., 1.
+    x0, y0, x1, y1 = np.broadcast_arrays(*map(np.asarray, (x0, y0, x1, y1)))
+    # 将边界情况对应的分母替换为 1，保证除法安全，结果由掩码剔除
+    edge = ((x0 == 0.) & (y0 == 1.)) | (x1 == 1.) | (y1 == 0.)
+    d = np.where(edge, 1., 1 - x1 ** q)
+    r = y0 / np.where(edge, 1., y1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = ((1 - x0 ** q) / d) ** (1 / q)
+        mask = ~edge & (0. <= r) & (r <= t) & (t <= 1.)
+        md = np.where(mask, np.round(((x0 ** q - x1 ** q) / d) ** (1 / q), Approx.round), 0.)
+    nmd = np.where(mask, np.round(r, Approx.round), 1.)
+    return md[()], nmd[()]
 
 
 def algebraic_mul(x0, y0, x1, y1, q):
@@ -72,16 +80,23 @@ def algebraic_div(x0, y0, x1, y1, q):
     :param x1:  第二个数的隶属度
     :param y1:  第二个数的非隶属度
     :param q:   Q 阶
+
+    The operands may be scalars or arrays of broadcastable shapes. Elements
+    which fall outside the domain of the division (the first number is the
+    unit element, the second number is the zero element, or the condition
+    0 <= x0/x1 <= ((1-y0^q)/(1-y1^q))^(1/q) <= 1 does not hold) give (1, 0).
     """
-    if x0 == 1. and y0 == 0.:
-        return 1., 0.
-    if x1 == 0. or y1 == 1.:
-        return 1., 0.
-    if 0. <= x0 / x1 <= ((1 - y0 ** q) / (1 - y1 ** q)) ** (1 / q) <= 1.:
-        md = np.round(x0 / x1, Approx.round)
-        nmd = np.round(((y0 ** q - y1 ** q) / (1 - y1 ** q)) ** (1 / q), Approx.round)
-        return md, nmd
-    return 1., 0.
+    x0, y0, x1, y1 = np.broadcast_arrays(*map(np.asarray, (x0, y0, x1, y1)))
+    # 将边界情况对应的分母替换为 1，保证除法安全，结果由掩码剔除
+    edge = ((x0 == 1.) & (y0 == 0.)) | (x1 == 0.) | (y1 == 1.)
+    d = np.where(edge, 1., 1 - y1 ** q)
+    r = x0 / np.where(edge, 1., x1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = ((1 - y0 ** q) / d) ** (1 / q)
+        mask = ~edge & (0. <= r) & (r <= t) & (t <= 1.)
+        nmd = np.where(mask, np.round(((y0 ** q - y1 ** q) / d) ** (1 / q), Approx.round), 0.)
+    md = np.where(mask, np.round(r, Approx.round), 1.)
+    return md[()], nmd[()]
 
 
 def algebraic_pow(p, x0, y0, q):
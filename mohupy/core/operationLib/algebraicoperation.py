@@ -13,6 +13,7 @@ from .algebraic import (algebraic_add,algebraic_sub,algebraic_mul,
                         algebraic_div,algebraic_pow,algebraic_times)
 
 from ..regedit import Registry
+from ..ragged import RaggedArray, pairwise
 
 algebAdd = Registry()
 algebSub = Registry()
@@ -38,15 +39,13 @@ def ivfn_algeb_add(x0, y0, x1, y1, q):
 
 @algebAdd('qrohfn')
 def qrohfn_algeb_add(x0, y0, x1, y1, q):
-    mds, nmds = np.array([]), np.array([])
-
-    m = np.array(np.meshgrid(x0, x1)).T.reshape(-1, 2)
-    n = np.array(np.meshgrid(y0, y1)).T.reshape(-1, 2)
-
-    for i in range(len(m)):
-        mds = np.append(mds, algebraic_add(m[i, 0], 0, m[i, 1], 0, q)[0])
-    for i in range(len(n)):
-        nmds = np.append(nmds, algebraic_add(0, n[i, 0], 0, n[i, 1], q)[1])
+    """
+        The degrees are 1-D arrays for a single fuzzy number, or RaggedArray
+        for a whole hesitant fuzzy array; every pair of membership (and of
+        non-membership) degrees is combined in one vectorized pass.
+    """
+    mds = pairwise(x0, x1, lambda a, b: algebraic_add(a, 0., b, 0., q)[0])
+    nmds = pairwise(y0, y1, lambda a, b: algebraic_add(0., a, 0., b, q)[1])
     return mds, nmds
 
 
@@ -89,15 +88,13 @@ def ivfn_algeb_mul(x0, y0, x1, y1, q):
 
 @algebMul('qrohfn')
 def qrohfn_algeb_mul(x0, y0, x1, y1, q):
-    mds, nmds = np.array([]), np.array([])
-
-    m = np.array(np.meshgrid(x0, x1)).T.reshape(-1, 2)
-    n = np.array(np.meshgrid(y0, y1)).T.reshape(-1, 2)
-
-    for i in range(len(m)):
-        mds = np.append(mds, algebraic_mul(m[i, 0], 0, m[i, 1], 0, q)[0])
-    for i in range(len(n)):
-        nmds = np.append(nmds, algebraic_mul(0, n[i, 0], 0, n[i, 1], q)[1])
+    """
+        The degrees are 1-D arrays for a single fuzzy number, or RaggedArray
+        for a whole hesitant fuzzy array; every pair of membership (and of
+        non-membership) degrees is combined in one vectorized pass.
+    """
+    mds = pairwise(x0, x1, lambda a, b: algebraic_mul(a, 0., b, 0., q)[0])
+    nmds = pairwise(y0, y1, lambda a, b: algebraic_mul(0., a, 0., b, q)[1])
     return mds, nmds
 
 
@@ -140,6 +137,10 @@ def ivfn_algeb_pow(p, x0, y0, q):
 
 @algebPow('qrohfn')
 def qrohfn_algeb_pow(p, x0, y0, q):
+    if isinstance(x0, RaggedArray):
+        mds = x0.apply(lambda v, l: algebraic_pow(l, v, 0., q)[0], p)
+        nmds = y0.apply(lambda v, l: algebraic_pow(l, 0., v, q)[1], p)
+        return mds, nmds
     return algebraic_pow(p, x0, y0, q)
 
 
@@ -159,4 +160,8 @@ def ivfn_algeb_times(p, x0, y0, q):
 
 @algebTim('qrohfn')
 def qrohfn_algeb_times(p, x0, y0, q):
+    if isinstance(x0, RaggedArray):
+        mds = x0.apply(lambda v, l: algebraic_times(l, v, 0., q)[0], p)
+        nmds = y0.apply(lambda v, l: algebraic_times(l, 0., v, q)[1], p)
+        return mds, nmds
     return algebraic_times(p, x0, y0, q)
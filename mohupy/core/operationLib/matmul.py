@@ -0,0 +1,192 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午2:49
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from ..regedit import Registry
+from ..constant import Approx
+
+"""
+Fuzzy matrix multiplication under the algebraic norms. The element (i, k) of x @ y
+is the algebraic sum over j of the algebraic products x[i, j] * y[j, k], i.e.
+
+    md^q  = 1 - prod_j (1 - md_x[i, j]^q * md_y[j, k]^q)
+    nmd^q = prod_j (1 - (1 - nmd_x[i, j]^q) * (1 - nmd_y[j, k]^q))
+
+Both are of the form exp(L) with L[i, k] = sum_j log(1 - u[i, j] * v[j, k]) for
+some u, v in [0, 1]. The summand does not separate into a function of u plus a
+function of v, so L is not a single matrix product, but
+
+    1.  -(u @ v) is an upper bound of L. Where it is below q * log(SATURATE),
+        md is 1 and nmd is 0 to well within Approx.round, and the element is
+        done. Large dense relations mostly end here.
+    2.  The remaining elements are evaluated either exactly, one inner product
+        at a time, or, when there are many of them, by the series
+        L = -sum_m (u^m @ v^m) / m, every term of which is a BLAS matrix product.
+        The series converges geometrically in u * v, so the pairs whose factors
+        both exceed a split point TAU are taken out of it and added exactly. Sparse
+        relations skip the zero pairs, which contribute nothing.
+"""
+
+algebMatmul = Registry()
+
+# The series is truncated at relative error EPS. The split point TAU is chosen
+# per product among TAUS: a smaller TAU needs fewer terms but leaves more pairs
+# to the exact evaluation.
+TAUS = (0.5, 0.25, 0.125, 0.0625)
+EPS = 1e-10
+
+# md^q = 1 - exp(L) and nmd^q = exp(L) are taken as saturated when exp(L) is
+# below this value.
+SATURATE = 1e-12
+
+# The cost of one term of a BLAS matrix product relative to one exact term
+# log1p(-u * v) evaluated by numpy.
+MATMUL_COST = 0.004
+
+# Number of float64 values of the temporary block of an exact evaluation (128 MB).
+BLOCK = 2 ** 24
+
+
+def series_terms(rho, eps=EPS):
+    """
+        Number of series terms so that the truncation error of every
+        log(1 - x), x <= rho, is below eps relative to its value.
+    """
+    if rho <= 0.:
+        return 0
+    m = 1
+    while rho ** m / ((m + 1) * (1. - rho)) > eps:
+        m += 1
+    return m
+
+
+def log_series(u, v, terms):
+    """
+        sum_j log(1 - u[i, j] * v[j, k]) as the truncated series of matrix
+        products.
+    """
+    L = np.zeros((u.shape[0], v.shape[1]))
+    pu, pv = u.copy(), v.copy()
+    for m in range(1, terms + 1):
+        if m > 1:
+            pu *= u
+            pv *= v
+        L -= (pu @ pv) / m
+    return L
+
+
+def log_exact(u, v, i, k):
+    """
+        sum_j log(1 - u[i, j] * v[j, k]) for the elements (i, k) given by two
+        index arrays, evaluated in blocks of inner products.
+    """
+    vt = np.ascontiguousarray(v.T)
+    out = np.empty(i.size)
+    b = max(1, BLOCK // max(1, u.shape[1]))
+    with np.errstate(divide='ignore'):
+        for s in range(0, i.size, b):
+            t = u[i[s:s + b]] * vt[k[s:s + b]]
+            np.log1p(-t, out=t)
+            np.sum(t, axis=1, out=out[s:s + b])
+    return out
+
+
+def log_pairs(L, u, v, mu, mv):
+    """
+        Add log(1 - u[i, j] * v[j, k]) to L[i, k] for the pairs where both
+        mu[i, j] and mv[j, k] are set, one column j at a time.
+    """
+    with np.errstate(divide='ignore'):
+        for j in np.flatnonzero(mu.any(axis=0) & mv.any(axis=1)):
+            i, k = np.flatnonzero(mu[:, j]), np.flatnonzero(mv[j])
+            L[np.ix_(i, k)] += np.log1p(-np.multiply.outer(u[i, j], v[j, k]))
+    return L
+
+
+def log_matmul(u, v, bound=-np.inf):
+    """
+        L[i, k] = sum_j log(1 - u[i, j] * v[j, k]) for 2-D u and v with entries
+        in [0, 1]. Elements whose value is below 'bound' may be returned as any
+        value below 'bound'.
+    """
+    n, m = u.shape
+    p = v.shape[1]
+    # log(1 - x) <= -x，上界低于 bound 的元素已经饱和
+    L = -(u @ v)
+    i, k = np.nonzero(L > bound)
+    if i.size == 0:
+        return L
+
+    # 可选的计算方式：逐个计算未饱和的元素、逐个计算非零的三元组，以及按各个 TAU 拆分的级数
+    uz, vz = u > 0., v > 0.
+    cost = [i.size * m, np.dot(uz.sum(axis=0), vz.sum(axis=1))]
+    terms = []
+    for tau in TAUS:
+        ul, vl = u > tau, v > tau
+        # 拆分后两部分中乘积的最大值
+        rho = (np.max(u, where=~ul, initial=0.) * v.max(initial=0.),
+               np.max(u, where=ul, initial=0.) * np.max(v, where=~vl, initial=0.))
+        terms.append(tuple(series_terms(r) for r in rho))
+        cost.append(MATMUL_COST * sum(terms[-1]) * n * m * p + np.dot(ul.sum(axis=0), vl.sum(axis=1)))
+
+    best = int(np.argmin(cost))
+    if best == 0:
+        L[i, k] = log_exact(u, v, i, k)
+        return L
+    if best == 1:
+        return log_pairs(np.zeros((n, p)), u, v, uz, vz)
+
+    # u 较小的组合，以及 u 较大、v 较小的组合，乘积均不超过 tau
+    tau, terms = TAUS[best - 2], terms[best - 2]
+    ul, vl = u > tau, v > tau
+    L = log_series(np.where(ul, 0., u), v, terms[0])
+    if terms[1]:
+        L += log_series(np.where(ul, u, 0.), np.where(vl, 0., v), terms[1])
+    return log_pairs(L, u, v, ul, vl)
+
+
+def batched(func, u, v, *args):
+    """
+        Apply a 2-D function over the broadcast leading (batch) axes.
+    """
+    batch = np.broadcast_shapes(u.shape[:-2], v.shape[:-2])
+    u = np.broadcast_to(u, batch + u.shape[-2:])
+    v = np.broadcast_to(v, batch + v.shape[-2:])
+    out = np.empty(batch + (u.shape[-2], v.shape[-1]))
+    for index in np.ndindex(*batch):
+        out[index] = func(u[index], v[index], *args)
+    return out
+
+
+def algebraic_matmul(x0, y0, x1, y1, q):
+    """
+    :param x0:  第一个矩阵的隶属度, (..., n, m)
+    :param y0:  第一个矩阵的非隶属度
+    :param x1:  第二个矩阵的隶属度, (..., m, p)
+    :param y1:  第二个矩阵的非隶属度
+    :param q:   Q 阶
+    """
+    assert x0.shape[-1] == x1.shape[-2], \
+        f'matmul: mismatch in core dimension ({x0.shape[-1]} and {x1.shape[-2]}).'
+    bound = q * np.log(SATURATE)
+    md = (0. - np.expm1(batched(log_matmul, x0 ** q, x1 ** q, bound))) ** (1. / q)
+    nmd = np.exp(batched(log_matmul, 1. - y0 ** q, 1. - y1 ** q, bound) / q)
+    return np.round(md, Approx.round), np.round(nmd, Approx.round)
+
+
+@algebMatmul('qrofn')
+def qrofn_algeb_matmul(x0, y0, x1, y1, q):
+    return algebraic_matmul(x0, y0, x1, y1, q)
+
+
+@algebMatmul('ivfn')
+def ivfn_algeb_matmul(x0, y0, x1, y1, q):
+    # 区间的上下界分别计算
+    lower = algebraic_matmul(x0[..., 0], y0[..., 0], x1[..., 0], y1[..., 0], q)
+    upper = algebraic_matmul(x0[..., 1], y0[..., 1], x1[..., 1], y1[..., 1], q)
+    return np.stack((lower[0], upper[0]), axis=-1), np.stack((lower[1], upper[1]), axis=-1)
@@ -0,0 +1,166 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午2:49
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+from ..regedit import Registry
+from ..constant import Approx
+
+"""
+The following are closed-form reductions of fuzzy arrays along axes, i.e. the
+n-ary forms of the Archimedean addition and multiplication. A reduction receives
+the membership and non-membership arrays, the qrung, a tuple of the axes to reduce,
+keepdims and optional weights 'w' (broadcastable to the degree arrays), and returns
+the reduced degree arrays. The weighted sum is the aggregation sum(w_i * x_i), the
+weighted product is prod(x_i ** w_i).
+
+Products of many degrees are taken as sums of logarithms so that large reductions
+neither underflow early nor lose the precision of values close to 1.
+"""
+
+algebSum = Registry()
+algebProd = Registry()
+einsSum = Registry()
+einsProd = Registry()
+
+
+def weighted(t, w):
+    """
+        The generator values t times the weights w. A zero weight leaves its
+        term out, also when the generator is infinite at a boundary degree
+        (log(0) for nmd = 0, log1p(-1) for md = 1), where 0 * inf is nan.
+    """
+    if w is None:
+        return t
+    with np.errstate(invalid='ignore'):
+        return np.where(w == 0, 0., w * t)
+
+
+def _logsum(t, axis, keepdims, w):
+    return np.sum(weighted(t, w), axis=axis, keepdims=keepdims)
+
+
+def nary(norm, d, q, axis, keepdims, w=None):
+    """
+        The n-ary form of a norm given as a pair (generator, inverse): the
+        weighted sum of the generator values along the axes, mapped back by
+        the inverse. Sums over parts of an axis can be added before the
+        inverse is applied, which lets a reduction be computed block by block.
+    """
+    gen, inv = norm
+    return inv(_logsum(gen(d, q), axis, keepdims, w), q)
+
+
+def _algebraic_tgen(d, q):
+    with np.errstate(divide='ignore'):
+        return np.log(d)
+
+
+def _algebraic_tinv(s, q):
+    return np.exp(s)
+
+
+def _algebraic_sgen(d, q):
+    with np.errstate(divide='ignore'):
+        return np.log1p(-d ** q)
+
+
+def _algebraic_sinv(s, q):
+    return (-np.expm1(s)) ** (1. / q)
+
+
+def _einstein_tgen(d, q):
+    t = d ** q
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log(2. - t) - np.log(t)
+
+
+def _einstein_tinv(s, q):
+    return (2. / (np.exp(s) + 1.)) ** (1. / q)
+
+
+def _einstein_sgen(d, q):
+    t = d ** q
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log1p(t) - np.log1p(-t)
+
+
+def _einstein_sinv(s, q):
+    return np.tanh(s / 2.) ** (1. / q)
+
+
+# (generator, inverse) of the t-norm and t-conorm of every archimedean norm
+norms = {'algebraic': {'tnorm': (_algebraic_tgen, _algebraic_tinv),
+                       'snorm': (_algebraic_sgen, _algebraic_sinv)},
+         'einstein': {'tnorm': (_einstein_tgen, _einstein_tinv),
+                      'snorm': (_einstein_sgen, _einstein_sinv)}}
+
+
+def algebraic_tnorm(d, q, axis, keepdims, w=None):
+    """
+        prod(d_i ** w_i)
+    """
+    return nary(norms['algebraic']['tnorm'], d, q, axis, keepdims, w)
+
+
+def algebraic_snorm(d, q, axis, keepdims, w=None):
+    """
+        (1 - prod((1 - d_i^q) ** w_i)) ** (1/q)
+    """
+    return nary(norms['algebraic']['snorm'], d, q, axis, keepdims, w)
+
+
+def einstein_tnorm(d, q, axis, keepdims, w=None):
+    """
+        The n-ary Einstein t-norm of d_i^q through its generator
+        log((2 - t) / t), raised to 1/q.
+    """
+    return nary(norms['einstein']['tnorm'], d, q, axis, keepdims, w)
+
+
+def einstein_snorm(d, q, axis, keepdims, w=None):
+    """
+        The n-ary Einstein t-conorm of d_i^q through its generator
+        log((1 + t) / (1 - t)), raised to 1/q.
+    """
+    return nary(norms['einstein']['snorm'], d, q, axis, keepdims, w)
+
+
+################################################################
+# Algebraic Sum and Product
+################################################################
+
+@algebSum('qrofn')
+@algebSum('ivfn')
+def algeb_sum(md, nmd, q, axis, keepdims, w=None):
+    return np.round(algebraic_snorm(md, q, axis, keepdims, w), Approx.round), \
+        np.round(algebraic_tnorm(nmd, q, axis, keepdims, w), Approx.round)
+
+
+@algebProd('qrofn')
+@algebProd('ivfn')
+def algeb_prod(md, nmd, q, axis, keepdims, w=None):
+    return np.round(algebraic_tnorm(md, q, axis, keepdims, w), Approx.round), \
+        np.round(algebraic_snorm(nmd, q, axis, keepdims, w), Approx.round)
+
+
+################################################################
+# Einstein Sum and Product
+################################################################
+
+@einsSum('qrofn')
+@einsSum('ivfn')
+def eins_sum(md, nmd, q, axis, keepdims, w=None):
+    return np.round(einstein_snorm(md, q, axis, keepdims, w), Approx.round), \
+        np.round(einstein_tnorm(nmd, q, axis, keepdims, w), Approx.round)
+
+
+@einsProd('qrofn')
+@einsProd('ivfn')
+def eins_prod(md, nmd, q, axis, keepdims, w=None):
+    return np.round(einstein_tnorm(md, q, axis, keepdims, w), Approx.round), \
+        np.round(einstein_snorm(nmd, q, axis, keepdims, w), Approx.round)
@@ -0,0 +1,155 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午12:48
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+"""
+Out-of-core evaluation of columnar fuzzy arrays whose degrees are memory-mapped
+files (see fuzz_load with 'mmap_mode'). Elementwise kernels and axis reductions
+stream over blocks of the first axis of about Config.chunksize elements, so the
+memory in use depends on the block size and not on the size of the data. Results
+larger than one block are written to temporary memory-mapped files.
+"""
+
+
+def mapped(a):
+    """
+        Whether an ndarray is a view of a numpy.memmap.
+    """
+    while isinstance(a, np.ndarray):
+        if isinstance(a, np.memmap):
+            return True
+        a = a.base
+    return False
+
+
+def ondisk(*arrays):
+    return any(mapped(a) for a in arrays)
+
+
+def allocate(shape):
+    """
+        An uninitialized float64 array for a result: in memory when it fits in
+        one block, otherwise in a temporary memory-mapped file, which is
+        removed when the array is released.
+    """
+    import tempfile
+    from ..config import Config
+    shape = tuple(shape)
+    if int(np.prod(shape, dtype=np.int64)) <= Config.chunksize:
+        return np.empty(shape)
+    with tempfile.TemporaryFile(dir=Config.tmpdir) as f:
+        return np.memmap(f, dtype=np.float64, mode='w+', shape=shape)
+
+
+def blocks(shape):
+    """
+        Slices of the first axis of 'shape' holding about Config.chunksize
+        elements each.
+    """
+    from ..config import Config
+    row = max(1, int(np.prod(shape[1:], dtype=np.int64)))
+    step = max(1, Config.chunksize // row)
+    for s in range(0, shape[0], step):
+        yield slice(s, min(s + step, shape[0]))
+
+
+def elementwise(kernel, args, q):
+    """
+        Call an elementwise kernel 'kernel(*args, q)' block by block. The
+        arguments broadcast against each other, an argument is sliced when it
+        spans the first axis of the broadcast shape.
+    """
+    shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+    if len(shape) == 0 or shape[0] <= 1:
+        return kernel(*args, q)
+    md, nmd = allocate(shape), allocate(shape)
+    for s in blocks(shape):
+        part = [a[s] if np.ndim(a) == len(shape) and np.shape(a)[0] == shape[0] else a for a in args]
+        md[s], nmd[s] = kernel(*part, q)
+    return md, nmd
+
+
+def reduce(kernel, norms, md, nmd, q, axis, keepdims, w=None):
+    """
+        A closed-form reduction (see operationLib.reduction) of degree arrays
+        along 'axis', block by block over the first axis. 'norms' are the
+        (generator, inverse) pairs of the membership and the non-membership
+        reductions, 'w' is a scalar weight.
+
+        When the first axis is kept, every block is reduced on its own. When it
+        is reduced, the weighted generator sums of the blocks are added and the
+        inverses applied once at the end, which is the same computation as on
+        the whole array up to the order of the additions.
+    """
+    from .constant import Approx
+    from .operationLib.reduction import weighted
+    shape = md.shape
+    if 0 not in axis:
+        if keepdims:
+            kept = tuple(1 if i in axis else n for i, n in enumerate(shape))
+        else:
+            kept = tuple(n for i, n in enumerate(shape) if i not in axis)
+        out = [allocate(kept), allocate(kept)]
+        for s in blocks(shape):
+            out[0][s], out[1][s] = kernel(md[s], nmd[s], q, axis, keepdims, w)
+        return tuple(out)
+
+    acc = [None, None]
+    for s in blocks(shape):
+        for i, (d, norm) in enumerate(zip((md[s], nmd[s]), norms)):
+            gen = weighted(norm[0](d, q), w)
+            part = np.sum(gen, axis=axis, keepdims=True)
+            acc[i] = part if acc[i] is None else acc[i] + part
+    out = []
+    for a, norm in zip(acc, norms):
+        d = np.round(norm[1](a, q), Approx.round)
+        out.append(d if keepdims else np.squeeze(d, axis=axis))
+    return tuple(out)
+
+
+def argbest(keys, shape, axis, largest):
+    """
+        np.argmax (largest) or np.argmin of ranking keys along an axis, block
+        by block over the first axis. 'keys(s)' returns the (score, accuracy)
+        arrays of the block s; ties are broken by accuracy and then by the
+        first occurrence, as FuzzArgmax does.
+    """
+    sign = 1. if largest else -1.
+
+    def local(score, acc, ax):
+        best = score == np.max(score, axis=ax, keepdims=True)
+        return np.argmax(np.where(best, acc, -np.inf), axis=ax)
+
+    if axis is not None and axis % len(shape) != 0:
+        out = np.empty(shape[:axis % len(shape)] + shape[axis % len(shape) + 1:], dtype=np.int64)
+        for s in blocks(shape):
+            score, acc = keys(s)
+            out[s] = local(sign * score, sign * acc, axis)
+        return out
+
+    index, bs, ba = None, None, None
+    for s in blocks(shape):
+        score, acc = keys(s)
+        score, acc = sign * score, sign * acc
+        if axis is None:
+            score, acc = score.ravel(), acc.ravel()
+            i = local(score, acc, -1)
+            step = int(np.prod(shape[1:], dtype=np.int64))
+            i, score, acc = np.asarray(i + s.start * step), score[i], acc[i]
+        else:
+            i = local(score, acc, 0)
+            score = np.take_along_axis(score, i[None], 0)[0]
+            acc = np.take_along_axis(acc, i[None], 0)[0]
+            i = i + s.start
+        if index is None:
+            index, bs, ba = i, score, acc
+        else:
+            # 只有严格更优时才替换，保持第一次出现的位置
+            better = (score > bs) | ((score == bs) & (acc > ba))
+            index, bs, ba = np.where(better, i, index), np.where(better, score, bs), np.where(better, acc, ba)
+    return index[()] if axis is None else index
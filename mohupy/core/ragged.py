@@ -0,0 +1,248 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Date: 2024/4/6 下午12:48
+#  Author: yibow
+#  Email: yibocat@yeah.net
+#  Software: MohuPy
+
+import numpy as np
+
+
+class RaggedArray:
+    """
+        Ragged (CSR-style) array of variable-length float rows, used as the
+        columnar storage of hesitant fuzzy arrays.
+
+        The rows are stored back to back in one flat float64 buffer 'values',
+        row i occupying values[offsets[i]:offsets[i + 1]]. The rows are laid
+        out in C order over 'shape'. Both buffers are read-only.
+    """
+
+    def __init__(self, values, offsets, shape=None):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        assert offsets.ndim == 1 and offsets.size > 0, \
+            'offsets must be a non-empty 1-D array.'
+        assert offsets[0] == 0 and offsets[-1] == values.size, \
+            f'offsets do not match the values buffer: ({offsets[0]}, {offsets[-1]}) and {values.size}.'
+        if shape is None:
+            shape = (offsets.size - 1,)
+        shape = tuple(int(s) for s in np.atleast_1d(shape)) if np.ndim(shape) else ()
+        assert int(np.prod(shape, dtype=np.int64)) == offsets.size - 1, \
+            f'shape {shape} does not match the number of rows: {offsets.size - 1}.'
+
+        values, offsets = values.view(), offsets.view()
+        values.flags.writeable = False
+        offsets.flags.writeable = False
+        self.values = values
+        self.offsets = offsets
+        self.shape = shape
+
+    def __repr__(self):
+        return f'RaggedArray(shape={self.shape}, nvalues={self.values.size})'
+
+    @classmethod
+    def from_rows(cls, rows, shape=None):
+        """
+            Build a ragged array from an iterable of 1-D rows.
+
+            Parameters
+            ----------
+                rows:   iterable of array_like
+                    The rows, in C order over 'shape'.
+                shape:  tuple, optional
+                    The shape of the ragged array, default is (len(rows),).
+
+            Returns
+            -------
+                RaggedArray
+        """
+        rows = [np.asarray(r, dtype=np.float64).ravel() for r in rows]
+        lengths = np.fromiter((r.size for r in rows), dtype=np.int64, count=len(rows))
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = np.concatenate(rows) if rows else np.array([], dtype=np.float64)
+        return cls(values, offsets, shape)
+
+    @property
+    def size(self):
+        return self.offsets.size - 1
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def lengths(self):
+        """
+            The length of every row, as an int64 ndarray of shape 'shape'.
+        """
+        return np.diff(self.offsets).reshape(self.shape)
+
+    def row(self, i):
+        """
+            The i-th row (flat C-order index) as a read-only view.
+        """
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def segments(self):
+        """
+            The flat index of the row every value belongs to.
+        """
+        return np.repeat(np.arange(self.size), np.diff(self.offsets))
+
+    def reduce(self, ufunc=np.add, empty=np.nan):
+        """
+            Reduce every row with a numpy ufunc.
+
+            Rows of equal length are gathered into one 2-D block and reduced
+            along the contiguous axis, so every row gives bit for bit the same
+            result as ufunc.reduce on the row alone.
+
+            Parameters
+            ----------
+                ufunc:  numpy.ufunc
+                    The reduction, default is np.add.
+                empty:  float
+                    The result for rows without values.
+
+            Returns
+            -------
+                numpy.ndarray of shape 'shape'
+        """
+        lengths = np.diff(self.offsets)
+        out = np.full(self.size, empty, dtype=np.float64)
+        for l in np.unique(lengths[lengths > 0]):
+            rows = np.flatnonzero(lengths == l)
+            out[rows] = ufunc.reduce(self.values[self.offsets[rows][:, None] + np.arange(l)], axis=1)
+        return out.reshape(self.shape)
+
+    def dense(self, fill=np.nan):
+        """
+            The rows as an ndarray of shape 'shape + (K,)', K being the
+            largest length, with 'fill' after the end of every row.
+        """
+        lengths = np.diff(self.offsets)
+        k = int(lengths.max()) if self.size else 0
+        out = np.full((self.size, k), fill, dtype=np.float64)
+        out[self.segments(), np.arange(self.values.size) - np.repeat(self.offsets[:-1], lengths)] = self.values
+        return out.reshape(self.shape + (k,))
+
+    def to_object(self):
+        """
+            An object ndarray of shape 'shape' whose elements are the rows.
+        """
+        arr = np.empty(self.size, dtype=object)
+        for i in range(self.size):
+            arr[i] = np.array(self.row(i))
+        return arr.reshape(self.shape)
+
+    def take(self, index):
+        """
+            Gather rows by flat index.
+
+            Parameters
+            ----------
+                index:  array_like of int
+                    Flat row indices, the shape of 'index' becomes the shape
+                    of the result.
+
+            Returns
+            -------
+                RaggedArray
+        """
+        index = np.asarray(index, dtype=np.int64)
+        starts = self.offsets[:-1][index.ravel()]
+        lengths = self.offsets[1:][index.ravel()] - starts
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        # 每个值在所属行内的位置加上源行的起点，即为源缓冲区中的位置
+        local = np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+        values = self.values[np.repeat(starts, lengths) + local]
+        return RaggedArray(values, offsets, index.shape)
+
+    def reshape(self, *shape):
+        shape = shape[0] if len(shape) == 1 and isinstance(shape[0], (tuple, list)) else shape
+        shape = np.empty(self.shape, dtype=np.int8).reshape(shape).shape
+        return RaggedArray(self.values, self.offsets, shape)
+
+    def broadcast_to(self, shape):
+        shape = tuple(shape)
+        if shape == self.shape:
+            return self
+        index = np.broadcast_to(np.arange(self.size).reshape(self.shape), shape)
+        return self.take(index)
+
+    def apply(self, func, l=None):
+        """
+            Apply an element-wise function to the values, keeping the row
+            layout.
+
+            Parameters
+            ----------
+                func:   callable
+                    Called as func(values) or, when 'l' is given, as
+                    func(values, l) with 'l' repeated over every row.
+                l:      array_like, optional
+                    A parameter per row, broadcastable to 'shape'.
+
+            Returns
+            -------
+                RaggedArray
+        """
+        if l is None:
+            return RaggedArray(func(self.values), self.offsets, self.shape)
+        l = np.asarray(l)
+        if l.ndim > 0:
+            l = np.repeat(np.broadcast_to(l, self.shape).ravel(), np.diff(self.offsets))
+        return RaggedArray(func(self.values, l), self.offsets, self.shape)
+
+
+def broadcast_ragged(*xs):
+    """
+        Broadcast ragged arrays against each other by their row shapes.
+    """
+    shape = np.broadcast_shapes(*(x.shape for x in xs))
+    return tuple(x.broadcast_to(shape) for x in xs)
+
+
+def pairwise(a, b, func):
+    """
+        Combine every value of a row of 'a' with every value of the matching
+        row of 'b', in the order of np.meshgrid(a, b).T.reshape(-1, 2), and
+        apply an element-wise function to the pairs.
+
+        Parameters
+        ----------
+            a, b:   RaggedArray or 1-D array_like
+                Ragged arrays are broadcast against each other, two 1-D arrays
+                are treated as a single pair of rows.
+            func:   callable
+                Called as func(a_values, b_values) on the flat pairs.
+
+        Returns
+        -------
+            RaggedArray, or an ndarray when 'a' and 'b' are plain arrays.
+    """
+    if not isinstance(a, RaggedArray) and not isinstance(b, RaggedArray):
+        a = np.asarray(a, dtype=np.float64).ravel()
+        b = np.asarray(b, dtype=np.float64).ravel()
+        return func(np.repeat(a, b.size), np.tile(b, a.size))
+
+    if not isinstance(a, RaggedArray):
+        a = RaggedArray.from_rows([a], ())
+    if not isinstance(b, RaggedArray):
+        b = RaggedArray.from_rows([b], ())
+    a, b = broadcast_ragged(a, b)
+
+    la, lb = np.diff(a.offsets), np.diff(b.offsets)
+    lengths = la * lb
+    offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    # 第 k 个组合在行内的位置 local 对应 a 的第 local // lb 个值与 b 的第 local % lb 个值
+    seg = np.repeat(np.arange(lengths.size), lengths)
+    local = np.arange(offsets[-1]) - offsets[:-1][seg]
+    ia = a.offsets[:-1][seg] + local // lb[seg]
+    ib = b.offsets[:-1][seg] + local % lb[seg]
+    return RaggedArray(func(a.values[ia], b.values[ib]), offsets, a.shape)
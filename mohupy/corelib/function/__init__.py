@@ -7,8 +7,8 @@
 
 __all__ = []
 
-from .io import fuzz_savez, fuzz_loadz, fuzz_to_csv, fuzz_from_csv
-__all__ += ['fuzz_savez', 'fuzz_loadz', 'fuzz_to_csv', 'fuzz_from_csv']
+from .io import fuzz_savez, fuzz_loadz, fuzz_save, fuzz_load, fuzz_to_csv, fuzz_from_csv
+__all__ += ['fuzz_savez', 'fuzz_loadz', 'fuzz_save', 'fuzz_load', 'fuzz_to_csv', 'fuzz_from_csv']
 
 
 from .construct import (fuzz_zeros, fuzz_negs, fuzz_poss, fuzz_full,
@@ -17,16 +17,16 @@ __all__ += ['fuzz_zeros', 'fuzz_negs', 'fuzz_poss', 'fuzz_full', 'fuzz_zeros_lik
             'fuzz_poss_like', 'fuzz_full_like', 'fuzz_negs_like']
 
 
-from .measure import fuzz_distance
-__all__ += ['fuzz_distance']
+from .measure import fuzz_distance, fuzz_cdist, fuzz_pdist, fuzz_index
+__all__ += ['fuzz_distance', 'fuzz_cdist', 'fuzz_pdist', 'fuzz_index']
 
 
 from .plot import fuzz_plot
 __all__ += ['fuzz_plot']
 
 
-from .string import fuzz_str2fuzz
-__all__ += ['fuzz_str2fuzz']
+from .string import fuzz_str2fuzz, fuzz_str2fuzz_batch
+__all__ += ['fuzz_str2fuzz', 'fuzz_str2fuzz_batch']
 
 
 from .extension import (fuzz_isscalar, fuzz_func4fuzz,
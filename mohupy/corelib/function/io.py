@@ -18,11 +18,32 @@ def fuzz_loadz(filename: str) -> Fuzzarray:
     return Loadz()(filename)
 
 
+def fuzz_save(x: Fuzzarray, filename: str):
+    """
+    以二进制格式保存模糊数组：JSON 文件头加上隶属度与非隶属度的原始数组
+    """
+    from ..lib import SaveBinary
+    SaveBinary(x)(filename)
+
+
+def fuzz_load(filename: str, mmap_mode=None) -> Fuzzarray:
+    """
+    读取二进制格式的模糊数组，不复制数据
+    :param mmap_mode:   None 时一次读入内存；'r'、'c' 或 'r+' 时以 numpy.memmap 映射文件
+    """
+    from ..lib import LoadBinary
+    return LoadBinary(mmap_mode)(filename)
+
+
 def fuzz_to_csv(x: Fuzzarray, filename:str, header=None, index_col=None):
     from ..lib import ToCSV
     ToCSV(x, header, index_col)(filename)
 
 
-def fuzz_from_csv(filename:str, qrung, header='infer', index_col=0) -> Fuzzarray:
+def fuzz_from_csv(filename:str, qrung, header='infer', index_col=0, chunksize=None) -> Fuzzarray:
+    """
+    读取 CSV 模糊表
+    :param chunksize:   None 时返回整个模糊数组；给定行数时返回逐块读取的模糊数组迭代器
+    """
     from ..lib import LoadCSV
-    return LoadCSV(qrung, header, index_col)(filename)
+    return LoadCSV(qrung, header, index_col, chunksize)(filename)
@@ -29,3 +29,69 @@ def fuzz_distance(f1: Fuzznum | Fuzzarray,
     """
     from ..lib import Distance
     return Distance()(f1, f2, param_l, param_t, indeterminacy)
+
+
+def fuzz_cdist(f1: Fuzzarray, f2: Fuzzarray,
+               param_l=2, param_t=1, indeterminacy=True, chunksize=None, out=None) -> np.ndarray:
+    """
+    The generalized distances between every element of f1 and every element of f2,
+    with the same parameters as fuzz_distance.
+    :param f1:              the first fuzzy array, N elements
+    :param f2:              the second fuzzy array, M elements
+    :param param_l:         the parameter of generalized distance
+    :param param_t:         the risk factor for normalization process
+    :param indeterminacy:   determines whether the distance contains indeterminacy
+    :param chunksize:       the number of values of the intermediate arrays of one block of
+                            rows, default is Config.chunksize
+    :param out:             optional output array of shape f1.shape + f2.shape
+    :return:                the distance matrix of shape f1.shape + f2.shape
+    """
+    from ..lib import PairwiseDistance
+    return PairwiseDistance(param_l, param_t, indeterminacy, chunksize)(f1, f2, out)
+
+
+def fuzz_pdist(f: Fuzzarray,
+               param_l=2, param_t=1, indeterminacy=True, chunksize=None) -> np.ndarray:
+    """
+    The generalized distances between all pairs of elements of a fuzzy array, in the
+    condensed form of scipy.spatial.distance.pdist: the distance of the elements i < j
+    of the flattened array is at index n * i - i * (i + 1) / 2 + j - i - 1.
+    :param f:               the fuzzy array, n elements
+    :param param_l:         the parameter of generalized distance
+    :param param_t:         the risk factor for normalization process
+    :param indeterminacy:   determines whether the distance contains indeterminacy
+    :param chunksize:       the number of values of the intermediate arrays of one block
+    :return:                the condensed distance vector of n * (n - 1) / 2 values
+    """
+    from ..lib import PairwiseDistance
+    from ...config import Config
+    from ...core.construct import FuzzSetFromArrays
+    f = f.ravel()
+    if not f.columnar:
+        f = FuzzSetFromArrays(f.qrung, False, f.mtype)(*f.columns)
+    n = f.size
+    out = np.empty(n * (n - 1) // 2)
+    # 每块计算若干行与其后全部元素的距离，只保留上三角部分
+    rows = max(1, (chunksize or Config.chunksize) // max(1, n))
+    start = 0
+    for s in range(0, n, rows):
+        e = min(s + rows, n)
+        d = PairwiseDistance(param_l, param_t, indeterminacy, chunksize)(f[s:e], f[s:])
+        for i in range(e - s):
+            out[start:start + n - s - i - 1] = d[i, i + 1:]
+            start += n - s - i - 1
+    return out
+
+
+def fuzz_index(f: Fuzzarray, param_l=2, indeterminacy=True, leafsize=16):
+    """
+    A nearest-neighbour index over the elements of a q-rofn or ivfn fuzzy array under
+    the generalized distance, with query(x, k) and query_radius(x, r). It needs scipy.
+    :param f:               the fuzzy array to index
+    :param param_l:         the parameter of generalized distance, at least 1
+    :param indeterminacy:   determines whether the distance contains indeterminacy
+    :param leafsize:        the leaf size of the KD-tree
+    :return:                FuzzIndex
+    """
+    from ..lib import FuzzIndex
+    return FuzzIndex(f, param_l, indeterminacy, leafsize)
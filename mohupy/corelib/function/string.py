@@ -5,7 +5,7 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
-from ...core import Fuzznum
+from ...core import Fuzznum, Fuzzarray
 
 
 def fuzz_str2fuzz(s: str, qrung: int) -> Fuzznum:
@@ -19,3 +19,17 @@ def fuzz_str2fuzz(s: str, qrung: int) -> Fuzznum:
     """
     from ..lib import StrToFuzz
     return StrToFuzz(qrung)(s)
+
+
+def fuzz_str2fuzz_batch(strings, qrung: int, mtype=None) -> Fuzzarray:
+    """
+    将字符串数组一次性转换为模糊数组，形状与字符串数组相同
+    字符串形式与 fuzz_str2fuzz 相同，不逐个构造模糊数
+
+    :param strings: 字符串数组或列表
+    :param qrung:   待转换的模糊数的q阶序对
+    :param mtype:   模糊数类型，默认为当前 Config.mtype
+    :return:        模糊数组
+    """
+    from ..lib import StrToFuzzBatch
+    return StrToFuzzBatch(qrung, mtype)(strings)
@@ -9,10 +9,10 @@ from .classConstruct import (ZerosConstruct, PossConstruct, NegsConstruct,
                              FullConstruct, ZerosLikeConstruct, PossLikeConstruct,
                              NegsLikeConstruct, FullLikeConstruct)
 
-from .classIO import Savez, Loadz, ToCSV, LoadCSV
-from .classMeasure import Distance
+from .classIO import Savez, Loadz, SaveBinary, LoadBinary, ToCSV, LoadCSV
+from .classMeasure import Distance, PairwiseDistance, FuzzIndex
 from .classPlot import Plot
-from .classString import StrToFuzz
+from .classString import StrToFuzz, StrToFuzzBatch
 from .classUtils import Isscalar, FuncForFuzz, AsFuzzarray
 
 # TODO: Absolute 和 Relu 还有待完善
@@ -83,6 +83,121 @@ class Loadz(Library):
         # raise IOError(f'Invalid load for {type(self.fuzz)}.')
 
 
+# Binary format of a fuzzy array (version 1):
+#   MAGIC (7 bytes) | version (uint8) | header length (uint32, little-endian) |
+#   JSON header | padding | raw arrays
+# The header holds 'mtype', 'qrung', 'shape' and the list of raw 'arrays', each
+# with its name, dtype, shape and byte offset from the start of the data section.
+# The data section and every array start at a multiple of ALIGN bytes, so the
+# arrays can be mapped in place.
+MAGIC = b'\x93MOHUFZ'
+VERSION = 1
+ALIGN = 64
+
+
+def _aligned(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+class SaveBinary(Library):
+    """
+        Save a fuzzy array to the binary format: the membership and
+        non-membership degrees as raw float64 arrays (values and row offsets
+        for hesitant mtypes) after a small JSON header.
+    """
+    def __init__(self, x: Fuzzarray):
+        self.fuzz = x
+
+    def function(self, path):
+        import json
+        from ...core import RaggedArray
+        from ...core.outofcore import blocks
+        if not isinstance(self.fuzz, Fuzzarray):
+            raise IOError(f'Invalid save for {type(self.fuzz)}.')
+
+        md, nmd = self.fuzz.columns
+        if isinstance(md, RaggedArray):
+            arrays = {'md.values': md.values, 'md.offsets': md.offsets,
+                      'nmd.values': nmd.values, 'nmd.offsets': nmd.offsets}
+        else:
+            arrays = {'md': md, 'nmd': nmd}
+
+        entries, offset = [], 0
+        for name, a in arrays.items():
+            a = np.ascontiguousarray(a)
+            arrays[name] = a
+            entries.append({'name': name, 'dtype': a.dtype.newbyteorder('<').str,
+                            'shape': list(a.shape), 'offset': offset})
+            offset = _aligned(offset + a.nbytes)
+        qrung = self.fuzz.qrung
+        header = json.dumps({'mtype': self.fuzz.mtype,
+                             'qrung': qrung.item() if isinstance(qrung, np.generic) else qrung,
+                             'shape': list(self.fuzz.shape),
+                             'arrays': entries}).encode('utf-8')
+
+        prefix = MAGIC + np.array(VERSION, dtype='u1').tobytes() + np.array(len(header), dtype='<u4').tobytes()
+        start = _aligned(len(prefix) + len(header))
+        with open(path, 'wb') as f:
+            f.write(prefix + header)
+            for e in entries:
+                f.write(b'\x00' * (start + e['offset'] - f.tell()))
+                # 分块写出，内存映射的数组不会被整体读入内存
+                a = arrays[e['name']].reshape(-1)
+                for s in blocks(a.shape):
+                    f.write(a[s].astype(e['dtype'], copy=False).tobytes())
+
+
+class LoadBinary(Library):
+    """
+        Load a fuzzy array from the binary format.
+
+        The degrees are not copied: without 'mmap_mode' the file is read once
+        and the columns are views of that buffer, with 'mmap_mode' ('r', 'c'
+        or 'r+', as for numpy.memmap) they are memory-mapped from the file,
+        which also works for files larger than memory. The mtype is taken from
+        the file and the global Config is left unchanged.
+    """
+    def __init__(self, mmap_mode=None):
+        self.mmap_mode = mmap_mode
+
+    def function(self, path):
+        import json
+        from ...core import RaggedArray
+        with open(path, 'rb') as f:
+            prefix = f.read(len(MAGIC) + 5)
+            if prefix[:len(MAGIC)] != MAGIC:
+                raise IOError(f'Not a fuzzy array file: {path}.')
+            version = prefix[len(MAGIC)]
+            if version != VERSION:
+                raise IOError(f'Unsupported file version: {version}.')
+            length = int(np.frombuffer(prefix[len(MAGIC) + 1:], dtype='<u4')[0])
+            header = json.loads(f.read(length).decode('utf-8'))
+            start = _aligned(len(prefix) + length)
+            buffer = None if self.mmap_mode else f.read()
+
+        arrays = {}
+        for e in header['arrays']:
+            shape = tuple(e['shape'])
+            if self.mmap_mode:
+                arrays[e['name']] = np.memmap(path, dtype=e['dtype'], mode=self.mmap_mode,
+                                              offset=start + e['offset'], shape=shape)
+            else:
+                count = int(np.prod(shape, dtype=np.int64))
+                offset = start + e['offset'] - len(prefix) - length
+                arrays[e['name']] = np.frombuffer(buffer, dtype=e['dtype'], count=count,
+                                                  offset=offset).reshape(shape)
+
+        newset = Fuzzarray(header['qrung'])
+        newset.mtype = header['mtype']
+        shape = tuple(header['shape'])
+        if 'md' in arrays:
+            newset.columns = (arrays['md'], arrays['nmd'])
+        else:
+            newset.columns = (RaggedArray(arrays['md.values'], arrays['md.offsets'], shape),
+                              RaggedArray(arrays['nmd.values'], arrays['nmd.offsets'], shape))
+        return newset
+
+
 class ToCSV(Library):
     """
         Save a fuzzy set to a .csv file.
@@ -90,13 +205,12 @@ class ToCSV(Library):
         This method only saves the fuzzy set, and does not save the related
         information of the set.
 
-        Returns
-        -------
-            Boolean
-
         Notes
         -----
-            This method saves the fuzzy set to a.csv file.
+            The cells are formatted from the membership and non-membership
+            arrays by fuzzFormat[mtype], every degree in full, and written in
+            blocks of rows (see Config.chunksize), so the table is never held
+            as Fuzznum or string objects as a whole.
     """
     def __init__(self, fuzz: Fuzzarray, header, index_col):
         self.fuzz = fuzz
@@ -104,16 +218,28 @@ class ToCSV(Library):
         self.index_col = index_col
 
     def function(self, path: str):
-        if 0 <= self.fuzz.ndim <= 2:
-            try:
-                if isinstance(self.fuzz.array, Fuzzarray):
-                    pd.DataFrame(self.fuzz.array, columns=self.header, index=self.index_col).to_csv(path)
-                else:
-                    pd.DataFrame(np.array(self.fuzz), columns=self.header, index=self.index_col).to_csv(path)
-            except Exception as e:
-                raise IOError(f'{e}: Save failed.')
-        else:
+        from ..regedit import fuzzFormat
+        from ...core import RaggedArray
+        from ...core.outofcore import blocks
+        if not 0 <= self.fuzz.ndim <= 2:
             raise ValueError(f'The ndim of fuzzy array is invalid: ndim={self.fuzz.ndim}')
+        rows = self.fuzz.shape[0] if self.fuzz.ndim > 0 else 1
+        cols = self.fuzz.shape[1] if self.fuzz.ndim > 1 else 1
+        md, nmd = self.fuzz.columns
+        try:
+            with open(path, 'w', newline='') as f:
+                for k, s in enumerate(blocks((rows, cols))):
+                    if isinstance(md, RaggedArray):
+                        index = np.arange(s.start * cols, s.stop * cols).reshape(-1, cols)
+                        part = md.take(index), nmd.take(index)
+                    else:
+                        tail = md.shape[self.fuzz.ndim:]
+                        part = md.reshape((rows, cols) + tail)[s], nmd.reshape((rows, cols) + tail)[s]
+                    index = range(s.start, s.stop) if self.index_col is None else pd.Index(self.index_col)[s]
+                    pd.DataFrame(fuzzFormat[self.fuzz.mtype](*part), columns=self.header,
+                                 index=index).to_csv(f, header=k == 0)
+        except Exception as e:
+            raise IOError(f'{e}: Save failed.')
 
 
 class LoadCSV(Library):
@@ -127,31 +253,65 @@ class LoadCSV(Library):
         load when the fuzzy set table is equal to or satisfied with the initial fuzzy set
         condition.
 
+        The table is read in blocks of 'chunksize' rows, every block is parsed
+        by fuzzStrings[mtype] with one compiled pattern and checked by
+        FuzzSetFromArrays. Without 'chunksize' the blocks are joined into one
+        fuzzy array, otherwise an iterator over the blocks is returned, which
+        reads files of any length in bounded memory.
 
         Returns
         -------
-            Fuzzarray
+            Fuzzarray or iterator of Fuzzarray
                 The fuzzy set.
 
         Notes
         -----
             This method loads the fuzzy set from a.csv file.
     """
-    def __init__(self, qrung, header, index_col):
+    def __init__(self, qrung, header, index_col, chunksize=None):
         self.qrung = qrung
         self.header = header
         self.index_col = index_col
+        self.chunksize = chunksize
+
+    def chunks(self, path, chunksize):
+        from ..regedit import fuzzStrings
+        from ...core.construct import FuzzSetFromArrays
+        from ...config import Config
+        reader = pd.read_csv(path, header=self.header, index_col=self.index_col, dtype=str,
+                             keep_default_na=False, chunksize=chunksize)
+        with reader:
+            for df in reader:
+                md, nmd = fuzzStrings[Config.mtype](df.to_numpy(dtype=object))
+                yield FuzzSetFromArrays(self.qrung)(md, nmd)
 
     def function(self, path: str):
+        from ...config import Config
+        if self.chunksize is not None:
+            return self.chunks(path, self.chunksize)
         try:
-            m = pd.read_csv(path, header=self.header, index_col=self.index_col).to_numpy()
-            from .classString import StrToFuzz
-            vec_func = np.vectorize(lambda x: StrToFuzz(self.qrung)(x))
+            # 每块的行数按 64 列估计，使每块约有 Config.chunksize 个单元格
+            parts = list(self.chunks(path, max(1, Config.chunksize // 64)))
+            from ...core import RaggedArray
+            mds, nmds = zip(*(p.columns for p in parts))
+            if isinstance(mds[0], RaggedArray):
+                mds, nmds = _concat_ragged(mds), _concat_ragged(nmds)
+            else:
+                mds, nmds = np.concatenate(mds), np.concatenate(nmds)
             newset = Fuzzarray(self.qrung)
-            try:
-                newset.array = vec_func(m)
-                return newset
-            except Exception as e:
-                Exception(f'Please check if the mtype type matches. error:{e}')
+            newset.columns = (mds, nmds)
+            return newset
         except Exception as e:
             print(f'{e}: Load failed.')
+
+
+def _concat_ragged(parts):
+    """
+        Join RaggedArray blocks of shape (rows, cols) along the rows.
+    """
+    from ...core import RaggedArray
+    offsets = [parts[0].offsets]
+    for p in parts[1:]:
+        offsets.append(p.offsets[1:] + offsets[-1][-1])
+    shape = (sum(p.shape[0] for p in parts),) + parts[0].shape[1:]
+    return RaggedArray(np.concatenate([p.values for p in parts]), np.concatenate(offsets), shape)
@@ -8,7 +8,7 @@
 import numpy as np
 
 from .base import Library
-from ..regedit import fuzzDis
+from ..regedit import fuzzDis, fuzzDisArray, fuzzCdist, fuzzEmbed
 from ...core import Fuzznum, Fuzzarray
 from ...config import Config
 
@@ -39,6 +39,8 @@ class Distance(Library):
 
         if isinstance(f1, Fuzznum) and isinstance(f2, Fuzznum):
             return fuzzDis[Config.mtype](f1, f2, l, t, indeterminacy)
+        if Config.mtype in fuzzDisArray:
+            return fuzzDisArray[Config.mtype](f1, f2, l, t, indeterminacy)
         if isinstance(f1, Fuzznum) and isinstance(f2, Fuzzarray):
             vec_func = np.vectorize(fuzzDis[Config.mtype])
             return vec_func(f1, f2.array, l, t, indeterminacy)
@@ -48,3 +50,116 @@ class Distance(Library):
         if isinstance(f1, Fuzzarray) and isinstance(f2, Fuzzarray):
             vec_func = np.vectorize(fuzzDis[Config.mtype])
             return vec_func(f1.array, f2.array, l, t, indeterminacy)
+
+
+class PairwiseDistance(Library):
+    """
+        Distances of fuzzDis between all pairs of elements of two fuzzy arrays,
+        computed with the array kernels in fuzzCdist.
+
+        The result has the shape 'x.shape + y.shape'. The elements of x are
+        processed in blocks of rows so that the intermediate arrays of a block
+        hold about 'chunksize' values (Config.chunksize by default). The result
+        is written into 'out' when it is given, e.g. a numpy.memmap for
+        matrices larger than memory.
+    """
+    def __init__(self, l, t, indeterminacy, chunksize=None):
+        self.l = l
+        self.t = t
+        self.indeterminacy = indeterminacy
+        self.chunksize = chunksize
+
+    def function(self, x, y, out=None):
+        from ...core import RaggedArray
+        from ...core.construct import FuzzSetFromArrays
+        assert x.mtype == y.mtype, \
+            f'The mtypes of the two fuzzy arrays do not match: {x.mtype} and {y.mtype}.'
+        shape = x.shape + y.shape
+        if out is None:
+            out = np.empty(shape)
+        assert out.shape == shape, f'Invalid output shape: {out.shape}, expected {shape}.'
+
+        x, y = [f if f.columnar else FuzzSetFromArrays(f.qrung, False, f.mtype)(*f.columns)
+                for f in (x.ravel(), y.ravel())]
+        if x.size == 0 or y.size == 0:
+            return out
+        width = y.columns[0].lengths.max() if isinstance(y.columns[0], RaggedArray) else 1
+        rows = max(1, (self.chunksize or Config.chunksize) // max(1, y.size * width))
+        flat = out.reshape(x.size, y.size)
+        for s in range(0, x.size, rows):
+            flat[s:s + rows] = fuzzCdist[x.mtype](x[s:s + rows], y, self.l, self.t, self.indeterminacy)
+        return out
+
+
+class FuzzIndex:
+    """
+        Nearest-neighbour index over the elements of a q-rofn or ivfn fuzzy
+        array under the generalized distance of fuzzDis.
+
+        The elements are mapped to the coordinates of fuzzEmbed, where the
+        distance is a scaled Minkowski distance of order l, and stored in a
+        scipy.spatial.cKDTree. Queries take fuzzy numbers or arrays and return
+        distances and flat indices into the indexed array. The order l must
+        be at least 1, below that the distance is not a metric.
+
+        scipy is only needed when an index is built.
+    """
+
+    def __init__(self, x: Fuzzarray, l=2, indeterminacy=True, leafsize=16):
+        from scipy.spatial import cKDTree
+        assert x.mtype in fuzzEmbed, \
+            f'Nearest-neighbour index does not support mtype: {x.mtype}.'
+        assert l >= 1, \
+            'The value of l must be at least 1.'
+        self.qrung = x.qrung
+        self.mtype = x.mtype
+        self.l = l
+        self.indeterminacy = indeterminacy
+        self.size = x.size
+        coords, self.scale = fuzzEmbed[x.mtype](self.__flat(x), l, indeterminacy)
+        self.tree = cKDTree(coords, leafsize=leafsize)
+
+    def __flat(self, x):
+        from ...core.construct import FuzzSetFromArrays
+        if isinstance(x, Fuzznum):
+            x = FuzzSetFromArrays(x.qrung, False, x.mtype)(np.asarray(x.md), np.asarray(x.nmd))
+        assert x.mtype == self.mtype and x.qrung == self.qrung, \
+            f'The query must be of mtype {self.mtype} and qrung {self.qrung}: {x.mtype}, {x.qrung}.'
+        x = x.ravel()
+        if not x.columnar:
+            x = FuzzSetFromArrays(x.qrung, False, x.mtype)(*x.columns)
+        return x
+
+    def __coords(self, y):
+        shape = () if isinstance(y, Fuzznum) else y.shape
+        return fuzzEmbed[self.mtype](self.__flat(y), self.l, self.indeterminacy)[0], shape
+
+    def query(self, y, k=1, eps=0., distance_upper_bound=np.inf):
+        """
+            The k nearest elements of every element of y.
+
+            Returns
+            -------
+                (distance, index): arrays of shape y.shape + (k,), or y.shape
+                when k is 1. Missing neighbours (fewer than k elements within
+                'distance_upper_bound') have distance inf and index self.size.
+        """
+        coords, shape = self.__coords(y)
+        d, i = self.tree.query(coords, k=k, eps=eps, p=self.l,
+                               distance_upper_bound=distance_upper_bound / self.scale)
+        tail = () if k == 1 else (k,)
+        return (self.scale * d).reshape(shape + tail), i.reshape(shape + tail)
+
+    def query_radius(self, y, r, sort=False):
+        """
+            The indices of the elements within distance r of every element of
+            y, as a list for a fuzzy number or an object array of lists of
+            shape y.shape. With 'sort' the lists are in ascending order.
+        """
+        coords, shape = self.__coords(y)
+        res = self.tree.query_ball_point(coords, r / self.scale, p=self.l, return_sorted=sort)
+        if shape == ():
+            return res[0]
+        out = np.empty(len(res), dtype=object)
+        out[:] = res
+        return out.reshape(shape)
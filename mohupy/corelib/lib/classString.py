@@ -22,3 +22,18 @@ class StrToFuzz(Library):
 
 
 
+
+
+class StrToFuzzBatch(Library):
+    """
+        Convert an array of strings to a Fuzzarray in one pass, see
+        str2fuzz_batch.
+    """
+
+    def __init__(self, qrung, mtype=None):
+        self.qrung = qrung
+        self.mtype = mtype
+
+    def function(self, strings):
+        from ..regedit.str2num import str2fuzz_batch
+        return str2fuzz_batch(strings, self.qrung, self.mtype)
@@ -49,6 +49,9 @@ class Dot(Mathematics):
                 newset.array = result
                 return newset
         if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
+            # 向量与矩阵的点积即矩阵乘法
+            if 0 < x.ndim <= 2 and 0 < y.ndim <= 2:
+                return x @ y
             if x.ndim == 0 and y.ndim == 0:
                 return np.dot(x.array, y.array)
             else:
@@ -97,6 +100,9 @@ class Inner(Mathematics):
                 newset.array = result
                 return newset
         if isinstance(x, Fuzzarray) and isinstance(y, Fuzzarray):
+            # 向量与矩阵的内积即与 y 的转置做矩阵乘法
+            if 0 < x.ndim <= 2 and 0 < y.ndim <= 2:
+                return x @ y.T
             if x.ndim == 0 and y.ndim == 0:
                 return np.inner(x.array, y.array)
             else:
@@ -13,14 +13,15 @@ from ...config import Config
 
 
 class RandNum(Random):
-    def __init__(self, qrung, minnum, maxnum):
+    def __init__(self, qrung, minnum, maxnum, rng=None):
         self.qrung = qrung
         self.minnum = minnum
         self.maxnum = maxnum
+        self.rng = rng
 
     def function(self):
         from ..regedit import fuzzRandom
-        return fuzzRandom[Config.mtype](self.qrung, self.minnum, self.maxnum)
+        return fuzzRandom[Config.mtype](self.qrung, self.minnum, self.maxnum, self.rng)
 
 
 # def randnum(q: int, minnum=1, maxnum=5) -> Fuzznum:
@@ -29,21 +30,16 @@ class RandNum(Random):
 
 class RandSet(Random):
 
-    def __init__(self, qrung, minnum, maxnum):
+    def __init__(self, qrung, minnum, maxnum, rng=None):
         self.qrung = qrung
         self.minnum = minnum
         self.maxnum = maxnum
+        self.rng = rng
 
     def function(self, *n):
-
-        # from ..lib import zeros
-
-        from ..lib.classConstruct import ZerosConstruct
-        newset = ZerosConstruct(self.qrung)(*n)
-        vec_func = np.vectorize(lambda _: RandNum(self.qrung, self.minnum, self.maxnum)())
-        result = vec_func(newset.array)
-        newset.array = result
-        return newset
+        from ..regedit import fuzzRandomSet
+        shape = tuple(n[0]) if len(n) == 1 and isinstance(n[0], (tuple, list)) else n
+        return fuzzRandomSet[Config.mtype](self.qrung, shape, self.minnum, self.maxnum, self.rng)
 
 
 # def randset(*n, q=1, minnum=1, maxnum=5) -> Fuzzarray:
@@ -51,34 +47,48 @@ class RandSet(Random):
 
 
 class Rand(Random):
+    """
+        Random fuzzy numbers and arrays. 'rng' is a numpy Generator, SeedSequence
+        or int seed; without it the global numpy random state is used.
+    """
 
-    def __init__(self, qrung, minnum, maxnum):
+    def __init__(self, qrung, minnum, maxnum, rng=None):
         self.qrung = qrung
         self.minnum = minnum
         self.maxnum = maxnum
+        self.rng = rng
 
     def function(self, *n):
         if len(n) == 0:
-            return RandNum(self.qrung, self.minnum, self.maxnum)()
+            return RandNum(self.qrung, self.minnum, self.maxnum, self.rng)()
         else:
-            return RandSet(self.qrung, self.minnum, self.maxnum)(*n)
+            return RandSet(self.qrung, self.minnum, self.maxnum, self.rng)(*n)
 
 
 class Choice(Random):
-    def function(self, f, n, replace):
+    """
+        Random choice from a fuzzy array. 'rng' is a numpy Generator,
+        SeedSequence or int seed; without it the global numpy random state is used.
+    """
 
+    def __init__(self, rng=None):
+        self.rng = rng
+
+    def function(self, f, n, replace):
+        from ..regedit.random import generator
+        rng = generator(self.rng)
         if n is not None:
             from ...core import Fuzzarray
             if replace:
-                t = np.random.choice(f.array, size=n, replace=replace)
+                t = rng.choice(f.array, size=n, replace=replace)
                 f.array = t
                 return f
             else:
                 newset = Fuzzarray(f.qrung)
-                newset.array = np.random.choice(f.array, size=n, replace=replace)
+                newset.array = rng.choice(f.array, size=n, replace=replace)
                 return newset
         else:
-            return np.random.choice(f.array.flatten())
+            return rng.choice(f.array.flatten())
 
 
 def seed(x):
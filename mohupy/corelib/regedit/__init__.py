@@ -8,14 +8,14 @@
 
 from .construct import fuzzZeros, fuzzPoss, fuzzNegs, fuzzZero, fuzzPos, fuzzNeg
 
-from .distance import fuzzDis
+from .distance import fuzzDis, fuzzDisArray, fuzzCdist, fuzzEmbed
 
-from .str2num import fuzzString
+from .str2num import fuzzString, fuzzStrings, fuzzFormat
 
-from .random import fuzzRandom
+from .random import fuzzRandom, fuzzRandomSet
 
 from .plotlib import fuzzPlot
 
-from .random import fuzz_random_seed
+from .random import fuzz_random_seed, fuzz_random_spawn
 
-__all__ = ['fuzz_random_seed']
+__all__ = ['fuzz_random_seed', 'fuzz_random_spawn']
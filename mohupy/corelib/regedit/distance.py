@@ -5,12 +5,15 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
-import copy
 import numpy as np
 
 from ...core import Registry
+from ...core.funcitonClass import HesitantDegrees
 
 fuzzDis = Registry()
+fuzzDisArray = Registry()
+fuzzCdist = Registry()
+fuzzEmbed = Registry()
 
 
 @fuzzDis('qrofn')
@@ -106,28 +109,16 @@ def distance_qrohfn(d1, d2, l, t, indeterminacy=True):
     assert d1.qrung == d2.qrung, "the qrung of two fuzzy number must be equal."
     assert not d1.empty() and not d2.empty(), "the two q-rohfns must be not empty."
 
-    d_1 = copy.deepcopy(d1)
-    d_2 = copy.deepcopy(d2)
     q = d1.qrung
-    # from ...core import normalize
-
     from ...core.funcitonClass import FuzzNormalize
-    d_1, d_2 = FuzzNormalize(t)(d_1, d_2)
-
-    mds = 0.
-    nmds = 0.
+    d_1, d_2 = FuzzNormalize(t)(d1, d2)
 
     pi1 = d_1.ind
     pi2 = d_2.ind
     pi = np.fabs(pi1 ** q - pi2 ** q) ** l
 
-    for x in range(len(d_1.md)):
-        mds += np.fabs(d_1.md[x] ** q - d_2.md[x] ** q) ** l
-    for y in range(len(d_1.nmd)):
-        nmds += np.fabs(d_1.nmd[y] ** q - d_2.nmd[y] ** q) ** l
-
-    mds = mds / len(d_1.md)
-    nmds = nmds / len(d_1.nmd)
+    mds = np.sum(np.fabs(d_1.md ** q - d_2.md ** q) ** l) / len(d_1.md)
+    nmds = np.sum(np.fabs(d_1.nmd ** q - d_2.nmd ** q) ** l) / len(d_1.nmd)
 
     if indeterminacy:
         return (0.5 * (mds + nmds + pi)) ** (1 / l)
@@ -135,3 +126,153 @@ def distance_qrohfn(d1, d2, l, t, indeterminacy=True):
         return (0.5 * (mds + nmds)) ** (1 / l)
 
 
+################################################################
+# Pairwise distances
+################################################################
+
+"""
+The following compute the distances of fuzzDis between every element of a 1-D
+fuzzy array x and every element of a 1-D fuzzy array y at once, as a matrix of
+shape (x.size, y.size). The terms of the distance are outer differences of the
+degree arrays, so no Fuzznum is created.
+"""
+
+
+def _outer(a, b, l):
+    return np.fabs(np.subtract.outer(a, b)) ** l
+
+
+@fuzzCdist('qrofn')
+def cdist_qrofn(x, y, l, t=None, indeterminacy=True):
+    assert x.qrung == y.qrung, \
+        "q rung of two fuzzy numbers must be equal."
+    assert l > 0, \
+        "The value of l must be greater than 0."
+    q = x.qrung
+    (m1, n1), (m2, n2) = x.columns, y.columns
+    d = _outer(m1 ** q, m2 ** q, l) + _outer(n1 ** q, n2 ** q, l)
+    if indeterminacy:
+        d += _outer(x.ind ** q, y.ind ** q, l)
+    return (0.5 * d) ** (1 / l)
+
+
+@fuzzCdist('ivfn')
+def cdist_ivfn(x, y, l, t=None, indeterminacy=True):
+    assert x.qrung == y.qrung, \
+        "q rung of two fuzzy numbers must be equal."
+    assert l > 0, \
+        "The value of l must be greater than 0."
+    q = x.qrung
+    (m1, n1), (m2, n2) = x.columns, y.columns
+    d = _outer(m1[:, 0] ** q, m2[:, 0] ** q, l) + _outer(m1[:, 1] ** q, m2[:, 1] ** q, l) + \
+        _outer(n1[:, 0] ** q, n2[:, 0] ** q, l) + _outer(n1[:, 1] ** q, n2[:, 1] ** q, l)
+    if indeterminacy:
+        d += _outer(x.ind ** q, y.ind ** q, l)
+    # 与 distance_ivfn 相同，系数 0.25 在开方之外
+    return 0.25 * d ** (1 / l)
+
+
+def _hesitant_terms(h1, h2, q, l):
+    """
+        For every pair of elements of two HesitantDegrees: the mean of |a^q - b^q|^l
+        over the normalized degrees, and the means of a^q and of b^q.
+    """
+    shape = (h1.lengths.size, h2.lengths.size)
+    d, m1, m2 = np.empty(shape), np.empty(shape), np.empty(shape)
+    for a in np.unique(h1.lengths):
+        i = np.flatnonzero(h1.lengths == a)
+        for b in np.unique(h2.lengths):
+            j = np.flatnonzero(h2.lengths == b)
+            n = max(a, b)
+            u, v = h1.extend(n, i) ** q, h2.extend(n, j) ** q
+            index = np.ix_(i, j)
+            d[index] = np.sum(np.fabs(u[:, None, :] - v[None, :, :]) ** l, axis=-1) / n
+            m1[index] = (np.sum(u, axis=1) / n)[:, None]
+            m2[index] = (np.sum(v, axis=1) / n)[None, :]
+    return d, m1, m2
+
+
+@fuzzCdist('qrohfn')
+def cdist_qrohfn(x, y, l, t, indeterminacy=True):
+    """
+        Pairwise distance_qrohfn. Every pair is normalized to the larger
+        length of its membership and of its non-membership degrees, the
+        elements are grouped by their lengths so that each group of pairs is
+        a single broadcast over padded degree matrices.
+    """
+    assert 0 <= t <= 1, "risk factor 't' must be in [0,1] range."
+    assert x.qrung == y.qrung, "the qrung of two fuzzy number must be equal."
+    assert l > 0, "The value of l must be greater than 0."
+    q = x.qrung
+    (m1, n1), (m2, n2) = x.columns, y.columns
+    mds, mm1, mm2 = _hesitant_terms(HesitantDegrees(m1, t), HesitantDegrees(m2, t), q, l)
+    nmds, nn1, nn2 = _hesitant_terms(HesitantDegrees(n1, t), HesitantDegrees(n2, t), q, l)
+    d = mds + nmds
+    if indeterminacy:
+        with np.errstate(invalid='ignore'):
+            pi1 = np.where(mm1 + nn1 == 1., 0., (1. - mm1 - nn1) ** (1. / q))
+            pi2 = np.where(mm2 + nn2 == 1., 0., (1. - mm2 - nn2) ** (1. / q))
+        d += np.fabs(pi1 ** q - pi2 ** q) ** l
+    return (0.5 * d) ** (1 / l)
+
+
+@fuzzDisArray('qrohfn')
+def distance_qrohfn_array(x, y, l, t, indeterminacy=True):
+    """
+        distance_qrohfn of the pairs of elements of two fuzzy arrays (or of a
+        fuzzy number and an array) of broadcast shapes. All pairs are
+        normalized at once by FuzzNormalize and reduced over the dense
+        degrees, the nan after the normalized length of a pair are left out.
+    """
+    from ...core.funcitonClass import FuzzNormalize
+    assert 0 <= t <= 1, "risk factor 't' must be in [0,1] range."
+    assert x.qrung == y.qrung, "the qrung of two fuzzy number must be equal."
+    q = x.qrung
+    (m1, n1), (m2, n2) = FuzzNormalize(t)(x, y)
+    mlen, nlen = np.sum(~np.isnan(m1), axis=-1), np.sum(~np.isnan(n1), axis=-1)
+    d = np.nansum(np.fabs(m1 ** q - m2 ** q) ** l, axis=-1) / mlen + \
+        np.nansum(np.fabs(n1 ** q - n2 ** q) ** l, axis=-1) / nlen
+    if indeterminacy:
+        def pi(m, n):
+            s = np.nansum(m ** q, axis=-1) / mlen + np.nansum(n ** q, axis=-1) / nlen
+            with np.errstate(invalid='ignore'):
+                return np.where(s == 1., 0., (1. - s) ** (1. / q))
+        d = d + np.fabs(pi(m1, n1) ** q - pi(m2, n2) ** q) ** l
+    return (0.5 * d) ** (1 / l)
+
+
+################################################################
+# Embeddings
+################################################################
+
+"""
+For q-rofn and ivfn the generalized distance is a scaled Minkowski distance of
+order l between fixed coordinates of the elements: (md^q, nmd^q, pi^q) for q-rofn,
+and the bounds of md^q and nmd^q plus pi^q for ivfn, without pi^q when the
+indeterminacy is left out. An embedding returns the coordinates of a 1-D fuzzy
+array as an (n, k) matrix and the scale, so that
+
+    distance(x_i, x_j) = scale * ||coords_i - coords_j||_l
+
+which lets metric trees answer nearest-neighbour queries.
+"""
+
+
+@fuzzEmbed('qrofn')
+def embed_qrofn(x, l, indeterminacy=True):
+    q = x.qrung
+    md, nmd = x.columns
+    coords = [md ** q, nmd ** q]
+    if indeterminacy:
+        coords.append(x.ind ** q)
+    return np.stack(coords, axis=-1), 0.5 ** (1 / l)
+
+
+@fuzzEmbed('ivfn')
+def embed_ivfn(x, l, indeterminacy=True):
+    q = x.qrung
+    md, nmd = x.columns
+    coords = [md[:, 0] ** q, md[:, 1] ** q, nmd[:, 0] ** q, nmd[:, 1] ** q]
+    if indeterminacy:
+        coords.append(x.ind ** q)
+    return np.stack(coords, axis=-1), 0.25
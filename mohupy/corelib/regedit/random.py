@@ -13,8 +13,25 @@ from ...core import Registry, Approx
 fuzzRandom = Registry()
 
 
+def generator(rng=None):
+    """
+        The numpy Generator to draw from.
+
+        'rng' may be a Generator, which is used as is, or anything accepted by
+        numpy.random.default_rng (a SeedSequence, a BitGenerator or an int
+        seed). Without one, a Generator is seeded from the global numpy
+        RandomState, so fuzz_random_seed keeps the random fuzzy numbers and
+        arrays reproducible.
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if rng is None:
+        return np.random.default_rng(np.random.randint(0, 2 ** 32, size=4, dtype=np.uint64))
+    return np.random.default_rng(rng)
+
+
 @fuzzRandom('qrofn')
-def random_qrofn(q, minnum=None, maxnum=None):
+def random_qrofn(q, minnum=None, maxnum=None, rng=None):
     """
         Randomly generate a q-rung orthopair fuzzy number.
 
@@ -26,23 +43,26 @@ def random_qrofn(q, minnum=None, maxnum=None):
                 Minimum number of generated
             maxnum: int
                 Maximum number of generated
+            rng: numpy.random.Generator, optional
+                The random generator, see 'generator'.
 
         Returns
         -------
             Fuzznum
     """
     from ...core import fuzznum
+    rng = generator(rng)
     newfn = fuzznum(q, 0., 0.)
     while True:
-        newfn.md = np.round(np.random.rand(), Approx.round)
-        newfn.nmd = np.round(np.random.rand(), Approx.round)
+        newfn.md = np.round(rng.random(), Approx.round)
+        newfn.nmd = np.round(rng.random(), Approx.round)
         if newfn.valid():
             break
     return newfn
 
 
 @fuzzRandom('ivfn')
-def random_ivfn(q, minnum=None, maxnum=None):
+def random_ivfn(q, minnum=None, maxnum=None, rng=None):
     """
         Randomly generate a interval-valued q-rung orthopair fuzzy number.
 
@@ -54,23 +74,26 @@ def random_ivfn(q, minnum=None, maxnum=None):
                 Minimum number of generated
             maxnum: int
                 Maximum number of generated
+            rng: numpy.random.Generator, optional
+                The random generator, see 'generator'.
 
         Returns
         -------
             fuzznum
     """
     from ...core import fuzznum
+    rng = generator(rng)
     newfn = fuzznum(q, (0., 0.), (0., 0.))
     while True:
-        newfn.md = np.round(np.asarray([np.random.rand(), np.random.rand()]), Approx.round)
-        newfn.nmd = np.round(np.asarray([np.random.rand(), np.random.rand()]), Approx.round)
+        newfn.md = np.round(rng.random(2), Approx.round)
+        newfn.nmd = np.round(rng.random(2), Approx.round)
         if newfn.valid():
             break
     return newfn
 
 
 @fuzzRandom('qrohfn')
-def random_qrohfn(q, minnum, maxnum):
+def random_qrohfn(q, minnum, maxnum, rng=None):
     """
         Randomly generate a q-rung orthopair hesitant fuzzy number.
         Parameters
@@ -81,22 +104,211 @@ def random_qrohfn(q, minnum, maxnum):
                 Minimum number of generated
             maxnum: int
                 Maximum number of generated
+            rng: numpy.random.Generator, optional
+                The random generator, see 'generator'.
 
         Returns
         -------
             fuzznum
     """
     from ...core import fuzznum
+    rng = generator(rng)
     newfn = fuzznum(q, [], [])
-    newfn.md = np.round(np.random.rand(np.random.randint(minnum, maxnum)), Approx.round)
-    newfn.nmd = np.round(np.random.rand(np.random.randint(minnum, maxnum)), Approx.round)
     while True:
-        newfn.md = np.round(np.random.rand(np.random.randint(minnum, maxnum)), Approx.round)
-        newfn.nmd = np.round(np.random.rand(np.random.randint(minnum, maxnum)), Approx.round)
+        newfn.md = np.round(rng.random(rng.integers(minnum, maxnum)), Approx.round)
+        newfn.nmd = np.round(rng.random(rng.integers(minnum, maxnum)), Approx.round)
         if newfn.valid():
             break
     return newfn
 
 
+fuzzRandomSet = Registry()
+
+
+def rejection(n, draw, accept):
+    """
+        Vectorized rejection sampling with refill.
+
+        Parameters
+        ----------
+            n:      int
+                Number of samples.
+            draw:   callable
+                draw(k) returns a tuple of arrays holding k candidates along
+                the first axis.
+            accept: callable
+                accept(*candidates) returns the boolean mask of the accepted
+                candidates.
+
+        Returns
+        -------
+            tuple of arrays holding n accepted samples along the first axis.
+    """
+    parts, count, rate = [], 0, 1.
+    while count < n:
+        k = n - count
+        # 按已观察到的接受率多抽取一些，减少循环次数
+        xs = draw(int(min(k / rate * 1.1 + 16, 2 ** 24)))
+        mask = accept(*xs)
+        rate = max(mask.mean(), 1e-3)
+        parts.append(tuple(x[mask] for x in xs))
+        count += int(mask.sum())
+    return tuple(np.concatenate(p)[:n] for p in zip(*parts))
+
+
+@fuzzRandomSet('qrofn')
+def random_qrofn_set(q, shape, minnum=None, maxnum=None, rng=None):
+    """
+        Randomly generate a q-rung orthopair fuzzy array.
+
+        The degrees are drawn uniformly on [0, 1]^2 and rejected until
+        md^q + nmd^q <= 1, as random_qrofn does, but for the whole array at
+        once.
+
+        Parameters
+        ----------
+            q:  int
+                The q rung
+            shape: tuple
+                The shape of the fuzzy array
+            minnum: int
+                Minimum number of generated
+            maxnum: int
+                Maximum number of generated
+            rng: numpy.random.Generator, optional
+                The random generator, see 'generator'.
+
+        Returns
+        -------
+            Fuzzarray
+    """
+    from ...core.construct import FuzzSetFromArrays
+    rng = generator(rng)
+    md, nmd = rejection(int(np.prod(shape, dtype=np.int64)),
+                        lambda k: (np.round(rng.random(k), Approx.round),
+                                   np.round(rng.random(k), Approx.round)),
+                        lambda md, nmd: md ** q + nmd ** q <= 1.)
+    return FuzzSetFromArrays(q, False, 'qrofn')(md.reshape(shape), nmd.reshape(shape))
+
+
+@fuzzRandomSet('ivfn')
+def random_ivfn_set(q, shape, minnum=None, maxnum=None, rng=None):
+    """
+        Randomly generate an interval-valued q-rung orthopair fuzzy array.
+
+        Every bound pair is drawn as two sorted uniforms, which is the
+        distribution of random_ivfn conditioned on lower <= upper, and the
+        pairs are rejected until the upper bounds satisfy md^q + nmd^q <= 1.
+
+        Parameters
+        ----------
+            q:  int
+                The q rung
+            shape: tuple
+                The shape of the fuzzy array
+            minnum: int
+                Minimum number of generated
+            maxnum: int
+                Maximum number of generated
+            rng: numpy.random.Generator, optional
+                The random generator, see 'generator'.
+
+        Returns
+        -------
+            Fuzzarray
+    """
+    from ...core.construct import FuzzSetFromArrays
+    rng = generator(rng)
+    md, nmd = rejection(int(np.prod(shape, dtype=np.int64)),
+                        lambda k: (np.sort(np.round(rng.random((k, 2)), Approx.round), axis=1),
+                                   np.sort(np.round(rng.random((k, 2)), Approx.round), axis=1)),
+                        lambda md, nmd: md[:, 1] ** q + nmd[:, 1] ** q <= 1.)
+    return FuzzSetFromArrays(q, False, 'ivfn')(md.reshape(shape + (2,)), nmd.reshape(shape + (2,)))
+
+
+@fuzzRandomSet('qrohfn')
+def random_qrohfn_set(q, shape, minnum, maxnum, rng=None):
+    """
+        Randomly generate a q-rung orthopair hesitant fuzzy array.
+
+        Only the set sizes and the maxima of the membership and non-membership
+        sets decide whether random_qrohfn accepts a draw. The maximum of k
+        uniforms is drawn directly as U^(1/k), the pairs are rejected until
+        max(md)^q + max(nmd)^q <= 1, and the other k - 1 degrees are then drawn
+        uniformly below the maximum, which gives the distribution of
+        random_qrohfn without drawing the rejected sets.
+
+        Parameters
+        ----------
+            q:  int
+                The q rung
+            shape: tuple
+                The shape of the fuzzy array
+            minnum: int
+                Minimum number of generated
+            maxnum: int
+                Maximum number of generated
+            rng: numpy.random.Generator, optional
+                The random generator, see 'generator'.
+
+        Returns
+        -------
+            Fuzzarray
+    """
+    from ...core import Fuzzarray, RaggedArray
+    rng = generator(rng)
+
+    def draw(k):
+        l0, l1 = rng.integers(minnum, maxnum, k), rng.integers(minnum, maxnum, k)
+        # 空集合的最大值记为 0，与 random_qrohfn 中空集合总是有效一致
+        with np.errstate(divide='ignore'):
+            m0 = np.where(l0 > 0, rng.random(k) ** (1. / l0), 0.)
+            m1 = np.where(l1 > 0, rng.random(k) ** (1. / l1), 0.)
+        return l0, l1, np.round(m0, Approx.round), np.round(m1, Approx.round)
+
+    def degrees(lengths, maxima):
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = rng.random(offsets[-1]) * np.repeat(maxima, lengths)
+        full = lengths > 0
+        values[offsets[:-1][full] + rng.integers(0, lengths[full])] = maxima[full]
+        return RaggedArray(np.round(values, Approx.round), offsets, shape)
+
+    l0, l1, m0, m1 = rejection(int(np.prod(shape, dtype=np.int64)), draw,
+                               lambda l0, l1, m0, m1: m0 ** q + m1 ** q <= 1.)
+    newset = Fuzzarray(q)
+    newset.mtype = 'qrohfn'
+    newset.columns = (degrees(l0, m0), degrees(l1, m1))
+    return newset
+
+
 def fuzz_random_seed(seed):
     np.random.seed(seed)
+
+
+def fuzz_random_spawn(n, seed=None):
+    """
+        Spawn independent random generators, e.g. one per worker thread or
+        process. The streams depend only on 'seed' and their position, so
+        parallel runs are reproducible whatever the scheduling.
+
+        Parameters
+        ----------
+            n:  int
+                Number of generators.
+            seed: int, SeedSequence or Generator, optional
+                The root of the streams. A Generator spawns child streams of
+                its own. Without a seed, the root is drawn from the global
+                numpy RandomState (see fuzz_random_seed).
+
+        Returns
+        -------
+            list of numpy.random.Generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(n)
+    if not isinstance(seed, np.random.SeedSequence):
+        if seed is None:
+            seed = np.random.randint(0, 2 ** 32, size=4, dtype=np.uint64)
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(s) for s in seed.spawn(n)]
@@ -11,6 +11,30 @@ import numpy as np
 from ...core import Fuzznum, Registry
 
 fuzzString = Registry()
+fuzzStrings = Registry()
+fuzzFormat = Registry()
+
+
+"""
+A fuzzy number is written as the membership and the non-membership degrees,
+separated by commas or blanks, in a matched pair of brackets '<..>', '[..]' or '{..}'.
+The degrees of 'ivfn' and 'qrohfn' are lists in square brackets, e.g. '<0.5,0.3>',
+'[[0.1,0.2],[0.3,0.4]]' and '{[0.1 0.2 0.3],[0.4]}'. The patterns below are
+compiled once and shared by the parsers of single strings and of string arrays.
+"""
+
+NUMBER = r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?'
+_S = r'[ \t]*'
+_SEP = rf'(?:{_S},{_S}|[ \t]+)'
+# 开括号处的前瞻要求同一行以对应的闭括号结尾，不增加捕获组
+_OPEN = rf'^{_S}(?:<(?=.*>{_S}$)|\[(?=.*\]{_S}$)|\{{(?=.*\}}{_S}$)){_S}'
+_CLOSE = rf'{_S}[>\]}}]{_S}$'
+_PAIR = rf'\[{_S}({NUMBER}){_SEP}({NUMBER}){_S}\]'
+_LIST = rf'\[{_S}((?:{NUMBER}(?:{_SEP}{NUMBER})*)?){_S}\]'
+
+QROFN = re.compile(rf'{_OPEN}({NUMBER}){_SEP}({NUMBER}){_CLOSE}', re.M)
+IVFN = re.compile(rf'{_OPEN}{_PAIR}{_S},?{_S}{_PAIR}{_CLOSE}', re.M)
+QROHFN = re.compile(rf'{_OPEN}{_LIST}{_S},?{_S}{_LIST}{_CLOSE}', re.M)
 
 
 @fuzzString('qrofn')
@@ -27,40 +51,20 @@ def str2qrofn(s: str, q) -> Fuzznum:
             Fuzznum
 
         Notes: When the input data is 0, it should be set to ZERO
-        Q-rung fuzzy convert function accepts the form: [x,x]
+        Q-rung fuzzy convert function accepts the forms: <x,x>, [x,x]
     """
     from ...core import fuzznum
-    newfn = fuzznum(q, 0., 0.)
-    t = re.findall(r'^<(\d.*?\d)>$', s)
-    assert len(t) == 1, \
-        'data format error.'
-    x = re.findall(r'\d.?\d*', t[0])
-    assert len(x) == 2, \
-        'data format error.'
-    newfn.md = float(x[0])
-    newfn.nmd = float(x[1])
-    assert newfn.valid(), f'data format is correct, but the data is invalid: {s}'
-    return newfn
+    t = QROFN.fullmatch(s)
+    assert t is not None, f'data format error: {s!r}'
+    return fuzznum(q, float(t[1]), float(t[2]))
 
 
 @fuzzString('ivfn')
 def str2ivfn(s: str, q) -> Fuzznum:
     from ...core import fuzznum
-    newfn = fuzznum(q, (0., 0.), (0., 0.))
-    t2 = re.findall(r'\[(\d.*?\d)\s?]', s)
-    assert len(t2) == 2, \
-        'data format error.'
-    md = re.findall(r'\d.?\d*', t2[0])
-    nmd = re.findall(r'\d.?\d*', t2[1])
-    assert len(md) == 2 and len(nmd) == 2, \
-        'data format error.'
-
-    m = [float(md[0]), float(md[1])]
-    n = [float(nmd[0]), float(nmd[1])]
-    newfn.md = m
-    newfn.nmd = n
-    assert newfn.valid(), f'data format is correct, but the data is invalid: {s}'
-    return newfn
+    t = IVFN.fullmatch(s)
+    assert t is not None, f'data format error: {s!r}'
+    return fuzznum(q, (float(t[1]), float(t[2])), (float(t[3]), float(t[4])))
 
 
 @fuzzString('qrohfn')
@@ -71,6 +75,7 @@ def str2qrohfn(s: str, q) -> Fuzznum:
 
         Q-rung Hesitant Fuzzy convert function accepts three forms
         of input data:
+        <[x,x,x,x],[x,x,x,x]>;
         {[x,x,x,x],[x,x,x,x]};
         [[x,x,x,x],[x,x,x,x]].
 
@@ -85,17 +90,125 @@ def str2qrohfn(s: str, q) -> Fuzznum:
             MohuQROHFN
     """
     from ...core import fuzznum
-    newfn = fuzznum(q, [], [])
-    t2 = re.findall(r'\[(\d.*?\d)\s*?]', s)
-    assert len(t2) == 2, f'data format error:{t2}'
-    md = re.findall(r'\d.?\d*', t2[0])
-    nmd = re.findall(r'\d.?\d*', t2[1])
+    t = QROHFN.fullmatch(s)
+    assert t is not None, f'data format error: {s!r}'
+    md = np.array(t[1].replace(',', ' ').split(), dtype=np.float64)
+    nmd = np.array(t[2].replace(',', ' ').split(), dtype=np.float64)
+    return fuzznum(q, md, nmd)
+
+
+################################################################
+# Arrays of strings
+################################################################
+
+"""
+The following parse a whole array of strings into degree arrays instead of one
+Fuzznum per string: the strings are joined line by line and matched by the
+compiled pattern in a single pass with re.MULTILINE. They return (md, nmd) in the
+layout of FuzzSetFromArrays, which checks the degrees. The formatters are the
+inverse, they write every degree in full.
+"""
+
+def match_lines(pattern, strings):
+    """
+        The groups of 'pattern' in every string of an array, in one pass over
+        the joined strings.
+    """
+    strings = np.asarray(strings, dtype=object).ravel()
+    text = '\n'.join(strings)
+    groups = pattern.findall(text)
+    if len(groups) != strings.size or text.count('\n') != strings.size - 1:
+        # 找出第一个格式不正确的字符串
+        for e in strings:
+            assert isinstance(e, str) and '\n' not in e and pattern.match(e), \
+                f'data format error: {e!r}'
+    return groups
+
+
+def ragged_numbers(lists, shape):
+    """
+        A RaggedArray from strings of separated numbers, one row per string.
+    """
+    from ...core import RaggedArray
+    # 每行末尾加入 nan 作为分隔，一次 split 即得到全部数值与行边界
+    text = ' nan '.join(lists).replace(',', ' ') + ' nan' if len(lists) else ''
+    tokens = np.array(text.split(), dtype=np.float64)
+    ends = np.flatnonzero(np.isnan(tokens))
+    offsets = np.concatenate(([0], ends - np.arange(len(ends))))
+    return RaggedArray(tokens[~np.isnan(tokens)], offsets, shape)
+
+
+@fuzzStrings('qrofn')
+def strings2qrofn(strings):
+    shape = np.shape(strings)
+    d = np.array(match_lines(QROFN, strings), dtype=np.float64).reshape(shape + (2,))
+    return d[..., 0], d[..., 1]
+
 
-    for i in range(len(md)):
-        newfn.md = np.append(newfn.md, np.float64(md[i]))
-    for j in range(len(nmd)):
-        newfn.nmd = np.append(newfn.nmd, np.float64(nmd[j]))
+@fuzzStrings('ivfn')
+def strings2ivfn(strings):
+    shape = np.shape(strings)
+    d = np.array(match_lines(IVFN, strings), dtype=np.float64).reshape(shape + (2, 2))
+    return d[..., 0, :], d[..., 1, :]
 
-    assert newfn.valid(), f'data format is correct, but the data is invalid: {s}'
-    return newfn
 
+@fuzzStrings('qrohfn')
+def strings2qrohfn(strings):
+    shape = np.shape(strings)
+    groups = match_lines(QROHFN, strings)
+    return ragged_numbers([g[0] for g in groups], shape), ragged_numbers([g[1] for g in groups], shape)
+
+
+def str2fuzz_batch(strings, q, mtype=None):
+    """
+        Convert an array (or list) of strings to a columnar Fuzzarray of the
+        same shape. The strings are parsed in one pass by fuzzStrings[mtype]
+        and the degree arrays are checked and stored at once.
+
+        Parameters
+        ----------
+            strings : array_like of str
+            q : int
+            mtype : str, optional
+                The fuzzy number type, default is Config.mtype.
+        Returns
+        -------
+            Fuzzarray
+    """
+    from ...config import Config
+    from ...core.construct import FuzzSetFromArrays
+    mtype = Config.mtype if mtype is None else mtype
+    strings = np.asarray(strings, dtype=object)
+    return FuzzSetFromArrays(q, mtype=mtype)(*fuzzStrings[mtype](strings))
+
+
+def _join(*parts):
+    s = parts[0]
+    for p in parts[1:]:
+        s = np.strings.add(s, p)
+    return s
+
+
+@fuzzFormat('qrofn')
+def qrofn2strings(md, nmd):
+    return _join('<', md.astype(str), ',', nmd.astype(str), '>').astype(object)
+
+
+@fuzzFormat('ivfn')
+def ivfn2strings(md, nmd):
+    md, nmd = md.astype(str), nmd.astype(str)
+    return _join('<[', md[..., 0], ' ', md[..., 1], '],[', nmd[..., 0], ' ', nmd[..., 1], ']>').astype(object)
+
+
+@fuzzFormat('qrohfn')
+def qrohfn2strings(md, nmd):
+    def rows(r):
+        # 每行末尾插入换行符，整体连接后按行拆分
+        tokens = np.empty(r.values.size + r.size, dtype=object)
+        ends = r.offsets[1:] + np.arange(r.size)
+        mask = np.ones(tokens.size, dtype=bool)
+        mask[ends] = False
+        tokens[mask] = r.values.astype(str)
+        tokens[ends] = '\n'
+        return np.strings.strip(np.array(' '.join(tokens).split('\n')[:-1]))
+    return _join('<[', rows(md), '], [', rows(nmd), ']>').reshape(md.shape).astype(object)
@@ -5,9 +5,10 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 __all__ = []
-from .fuzzmeas import (dirac_meas, add_meas, sym_meas, lambda_meas,
-                       mobius_rep, zeta_rep, vector_rep, dict_rep)
-from .utils import (subsets, str_subsets, dicts, hasse_diagram)
+from .fuzzmeas import (dirac_meas, add_meas, sym_meas, lambda_meas, LambdaMeasure, MeasureTable,
+                       mobius_rep, zeta_rep, mobius_transform, zeta_transform,
+                       vector_rep, dict_rep)
+from .utils import (subsets, submasks, str_subsets, dicts, hasse_diagram)
 
 from .indices import *
 
@@ -18,11 +19,16 @@ __all__ += [
     'add_meas',
     'sym_meas',
     'lambda_meas',
+    'LambdaMeasure',
+    'MeasureTable',
     'mobius_rep',
     'zeta_rep',
+    'mobius_transform',
+    'zeta_transform',
     'vector_rep',
     'dict_rep',
     'subsets',
+    'submasks',
     'str_subsets',
     'dicts',
     'hasse_diagram',
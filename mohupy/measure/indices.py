@@ -5,6 +5,8 @@
 #  Email: yibocat@yeah.net
 #  Software: MohuPy
 
+import math
+
 import numpy as np
 
 
@@ -23,7 +25,7 @@ def deriv(e, sub, func, *args):
                 Elements or subsets to be differentiated
             sub : list or float or np.float64 or np.ndarray
                 The subset to be differentiated
-            func : function
+            func : function or MeasureTable
                 The fuzzy measure function
             args : list or np.ndarray
                 The fixed sets.
@@ -40,6 +42,11 @@ def deriv(e, sub, func, *args):
             2.  In [2]: deriv([0.4,0.25],[0.4,0.25,0.37], mp.lambda_meas, [0.4,0.25,0.37,0.2])
                 Out[2]: 0.5072507443907042
     """
+    from .fuzzmeas import MeasureTable
+    if isinstance(func, MeasureTable):
+        a, b = func.mask(e), func.mask(sub)
+        return func.values[b | a] - func.values[b & ~a]
+
     assert len(np.setdiff1d(e, *args)) == 0, \
         'ERROR: The element or list must be in the set.'
     assert len(np.setdiff1d(sub, *args)) == 0, \
@@ -50,6 +57,81 @@ def deriv(e, sub, func, *args):
     return func(union, *args) - func(differ, *args)
 
 
+class _Lattice:
+    """
+        The measures of the subsets of e in bitmask order over the elements
+            of e, gathered from the MeasureTable of func (built once from
+            func when it is a function), and the weights of the indices by
+            subset cardinality: with the fixed set of n elements, subset A is
+            weighted by w[|A|].
+    """
+
+    def __init__(self, e, func, args):
+        from .fuzzmeas import MeasureTable
+        from .utils import submasks
+        if not isinstance(func, MeasureTable):
+            func = MeasureTable.from_func(args[0], func, *args)
+        e = np.atleast_1d(e)
+        mask = func.mask(e)
+        sub = submasks(mask)
+        self.n = func.n
+        self.values = func.values[sub]
+        self.card = np.bitwise_count(sub).astype(np.int64)
+        # 元素在子集位掩码中的位序
+        self.bits = [bin(mask & (func.mask(x) - 1)).count('1') for x in e]
+
+    @staticmethod
+    def take(x, *bits):
+        """
+            The entries of x whose given bits are fixed to 0 or 1, as pairs
+            (bit, value), the bits in descending order.
+        """
+        # 每个固定的位对应 reshape 后长度为 2 的一根轴
+        shape, index, top = [], [], x.size.bit_length() - 1
+        for bit, value in bits:
+            shape += [1 << (top - bit - 1), 2]
+            index += [slice(None), value]
+            top = bit
+        return x.reshape(shape + [1 << top])[tuple(index)]
+
+    def weights(self, w):
+        """
+            The weight w[|A|] of every subset A of e, 0 beyond the end of w.
+        """
+        return np.append(w, np.zeros(max(0, int(self.card.max()) + 1 - len(w))))[self.card]
+
+    def marginals(self, w):
+        """
+            For every element i of e: the weights w[|A|] of the subsets A of
+                e without i and the marginal contributions μ(A ∪ i) - μ(A).
+        """
+        w = self.weights(w)
+        for b in self.bits:
+            yield self.take(w, (b, 0)), self.take(self.values, (b, 1)) - self.take(self.values, (b, 0))
+
+    def interactions(self, w):
+        """
+            For every pair i < j of e: the weights w[|A|] of the subsets A of
+                e without i and j and the second differences
+                μ(A ∪ ij) - μ(A ∪ i) - μ(A ∪ j) + μ(A).
+        """
+        w = self.weights(w)
+        for p, bi in enumerate(self.bits):
+            for q in range(p + 1, len(self.bits)):
+                hi, lo = max(bi, self.bits[q]), min(bi, self.bits[q])
+                v = [self.take(self.values, (hi, u), (lo, t)) for u in (0, 1) for t in (0, 1)]
+                yield p, q, self.take(w, (hi, 0), (lo, 0)), v[3] - v[2] - v[1] + v[0]
+
+
+def _shapley_weights(n, d=1):
+    """
+        The Shapley weights (n - |A| - d)! |A|! / (n - d + 1)! of the
+            subsets A of cardinality 0, ..., n - d.
+    """
+    return np.array([math.factorial(n - k - d) * math.factorial(k) / math.factorial(n - d + 1)
+                     for k in range(n - d + 1)])
+
+
 def shapley(e, func, *args):
     """
         Shapley value of a set. The Shapley value is interpreted as a kind
@@ -62,7 +144,7 @@ def shapley(e, func, *args):
         ----------
             e : list or float or np.float64 or np.ndarray
                 Elements or subsets to be differentiated
-            func : function
+            func : function or MeasureTable
                 The fuzzy measure function
             args : list or np.ndarray
                 The fixed sets.
@@ -80,18 +162,8 @@ def shapley(e, func, *args):
             2.  In [2]: shapley([0.4,0.25,0.2], mp.lambda_meas, [0.4,0.25,0.37,0.2])
                 Out[2]: [0.1871141  0.1143156  0.09078327]
     """
-    n = len(*args)
-    shap = np.array([])
-
-    from .utils import subsets
-    for x in e:
-        ts = np.array([])
-        for sub in subsets(np.setdiff1d(e, x)):
-            coef = np.math.factorial(n - len(sub) - 1) * \
-                   np.math.factorial(len(sub)) / np.math.factorial(n)
-            ts = np.append(ts, coef * deriv(x, sub, func, *args))
-        shap = np.append(shap, np.sum(ts))
-    return shap
+    lattice = _Lattice(e, func, args)
+    return np.array([np.sum(w * d) for w, d in lattice.marginals(_shapley_weights(lattice.n))])
 
 
 def banzhaf(e, func, *args):
@@ -104,7 +176,7 @@ def banzhaf(e, func, *args):
         ----------
             e : list or float or np.float64 or np.ndarray
                 Elements or subsets to be differentiated
-            func : function
+            func : function or MeasureTable
                 The fuzzy measure function
             args : list or np.ndarray
                 The fixed sets.
@@ -122,17 +194,9 @@ def banzhaf(e, func, *args):
             2.  In [2]: mp.banzhaf([0.4,0.25,0.37], mp.lambda_meas, [0.4,0.25,0.37,0.2])
                 Out[2]: [0.0925856  0.05584383 0.0850259 ]
     """
-    n = len(*args)
-    coef = 1/2**(n - 1)
-    ban = np.array([])
-
-    from .utils import subsets
-    for x in e:
-        ts = np.array([])
-        for sub in subsets(np.setdiff1d(e, x)):
-            ts = np.append(ts, coef * deriv(x, sub, func, *args))
-        ban = np.append(ban, np.sum(ts))
-    return ban
+    lattice = _Lattice(e, func, args)
+    coef = 1 / 2 ** (lattice.n - 1)
+    return np.array([coef * np.sum(d) for _, d in lattice.marginals([1.] * lattice.n)])
 
 
 def shannon(e, func, *args):
@@ -145,7 +209,7 @@ def shannon(e, func, *args):
         ----------
             e : list or float or np.float64 or np.ndarray
                 Elements or subsets to be differentiated
-            func : function
+            func : function or MeasureTable
                 The fuzzy measure function
             args : list or np.ndarray
                 The fixed sets.
@@ -163,15 +227,75 @@ def shannon(e, func, *args):
     """
     def _h(t):
         return -t*np.log(t)
-    n = len(*args)
-    shan = np.array([])
-
-    from .utils import subsets
-    for x in e:
-        ts = np.array([])
-        for sub in subsets(np.setdiff1d(e, x)):
-            coef = np.math.factorial(n - len(sub) - 1) * \
-                   np.math.factorial(len(sub)) / np.math.factorial(n)
-            ts = np.append(ts, coef * _h(deriv(x, sub, func, *args)))
-        shan = np.append(shan, np.sum(ts))
-    return shan
+
+    lattice = _Lattice(e, func, args)
+    return np.array([np.sum(w * _h(d)) for w, d in lattice.marginals(_shapley_weights(lattice.n))])
+
+
+def shapley_interaction(e, func, *args):
+    """
+        Shapley interaction index of the pairs of elements of a set. The
+            interaction of i and j is the weighted average of the second
+            differences μ(A ∪ ij) - μ(A ∪ i) - μ(A ∪ j) + μ(A) over the
+            subsets A of e without i and j, with the weights
+            (n - |A| - 2)! |A|! / (n - 1)!. It is positive when i and j are
+            complementary and negative when they are redundant.
+
+        Parameters
+        ----------
+            e : list or np.ndarray
+                The elements.
+            func : function or MeasureTable
+                The fuzzy measure function
+            args : list or np.ndarray
+                The fixed sets.
+
+        Returns
+        -------
+            np.ndarray
+                The symmetric matrix of the interaction indices of the pairs
+                of elements of e. The diagonal holds the Shapley values, the
+                interaction index of the single elements.
+
+        Examples
+        --------
+            In [1]: shapley_interaction([0.4,0.25,0.37], mp.lambda_meas, [0.4,0.25,0.37,0.2])
+            Out[1]: [[ 0.18239867 -0.02081952 -0.03138672]
+                     [-0.02081952  0.11147145 -0.01916839]
+                     [-0.03138672 -0.01916839  0.16794905]]
+    """
+    lattice = _Lattice(e, func, args)
+    res = np.diag([np.sum(w * d) for w, d in lattice.marginals(_shapley_weights(lattice.n))])
+    for i, j, w, d in lattice.interactions(_shapley_weights(lattice.n, 2)):
+        res[i, j] = res[j, i] = np.sum(w * d)
+    return res
+
+
+def banzhaf_interaction(e, func, *args):
+    """
+        Banzhaf interaction index of the pairs of elements of a set, the
+            second differences μ(A ∪ ij) - μ(A ∪ i) - μ(A ∪ j) + μ(A) over
+            the subsets A of e without i and j weighted equally by
+            1 / 2^(n - 2).
+
+        Parameters
+        ----------
+            e : list or np.ndarray
+                The elements.
+            func : function or MeasureTable
+                The fuzzy measure function
+            args : list or np.ndarray
+                The fixed sets.
+
+        Returns
+        -------
+            np.ndarray
+                The symmetric matrix of the interaction indices of the pairs
+                of elements of e, with the Banzhaf values on the diagonal.
+    """
+    lattice = _Lattice(e, func, args)
+    coef = 1 / 2 ** (lattice.n - 2)
+    res = np.diag([coef / 2 * np.sum(d) for _, d in lattice.marginals([1.] * lattice.n)])
+    for i, j, _, d in lattice.interactions([1.] * lattice.n):
+        res[i, j] = res[j, i] = coef * np.sum(d)
+    return res
@@ -43,6 +43,31 @@ def subsets(nums):
     return ans
 
 
+def submasks(mask):
+    """
+        Subsets of a subset encoded by a bitmask.
+
+        This method returns the bitmasks of all subsets of 'mask', in the
+        order of subsets(): the j-th bit of the position in the result
+        selects the j-th lowest set bit of 'mask'.
+
+        Parameters
+        ----------
+            mask : int
+                    The bitmask of the subset.
+        Returns
+        -------
+            np.ndarray
+            The bitmasks of the subsets, int64.
+    """
+    res = np.zeros(1, dtype=np.int64)
+    for i in range(int(mask).bit_length()):
+        if mask >> i & 1:
+            # 后一半为加入第 i 位的子集
+            res = np.concatenate((res, res | (1 << i)))
+    return res
+
+
 def str_subsets(nums):
     """
         Subsets of a set in string.
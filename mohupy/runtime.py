@@ -15,7 +15,8 @@
 from .corelib.regedit import *
 from .core import FuzzType, archimedeanDict
 from .corelib.regedit import (fuzzZeros, fuzzPoss, fuzzNegs,
-                              fuzzDis, fuzzString, fuzzRandom, fuzzPlot)
+                              fuzzDis, fuzzDisArray, fuzzCdist, fuzzEmbed, fuzzString, fuzzStrings, fuzzFormat,
+                              fuzzRandom, fuzzRandomSet, fuzzPlot)
 
 
 class info:
@@ -26,8 +27,14 @@ class info:
     poss = fuzzPoss
     negs = fuzzNegs
     distance = fuzzDis
+    distance_array = fuzzDisArray
+    cdist = fuzzCdist
+    embed = fuzzEmbed
     string = fuzzString
+    strings = fuzzStrings
+    format = fuzzFormat
     random = fuzzRandom
+    randomset = fuzzRandomSet
     plotlib = fuzzPlot
 
 
@@ -8,12 +8,12 @@
 from ...tensor import Fuzztensor
 
 
-def rand_tensor(*n, qrung=1) -> Fuzztensor:
+def rand_tensor(*n, qrung=1, rng=None) -> Fuzztensor:
     from ..random import TensorRandom
-    return TensorRandom(qrung)(*n)
+    return TensorRandom(qrung, rng)(*n)
 
 
 def random_choice_tensor(x: Fuzztensor,
-                         size: int | tuple[int] | list[int] = None, replace=False) -> Fuzztensor:
+                         size: int | tuple[int] | list[int] = None, replace=False, rng=None) -> Fuzztensor:
     from ..random import TensorChoice
-    return TensorChoice(size, replace)(x)
+    return TensorChoice(size, replace, rng)(x)
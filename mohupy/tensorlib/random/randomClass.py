@@ -11,21 +11,23 @@ from ...tensor import Fuzztensor
 
 class TensorRandom(Random):
 
-    def __init__(self, qrung):
+    def __init__(self, qrung, rng=None):
         self.qrung = qrung
+        self.rng = rng
 
     def function(self, *n):
         from ...corelib.random.randclass import Rand
-        r = Rand(self.qrung, 1, 5)(*n)
+        r = Rand(self.qrung, 1, 5, self.rng)(*n)
         return Fuzztensor(r)
 
 
 class TensorChoice(Random):
-    def __init__(self, size, replace):
+    def __init__(self, size, replace, rng=None):
         self.size = size
         self.replace = replace
+        self.rng = rng
 
     def function(self, fuzztensor):
         from ...corelib.random.randclass import Choice
-        r = Choice()(fuzztensor.data, self.size, self.replace)
+        r = Choice(self.rng)(fuzztensor.data, self.size, self.replace)
         return Fuzztensor(r)
@@ -0,0 +1,99 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Software: MohuPy
+
+"""
+    Micro-benchmark of BasicOperation against the former per-element path,
+    which looked up the kernel in archimedeanDict by Config.arch on every
+    call and called it twice per result, once for md and once for nmd.
+
+    Run with: python test/bench_operation.py [n] [repeat]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+import mohupy as mp
+from mohupy.config import Config
+from mohupy.core.fuzznums import Fuzznum
+from mohupy.core.operationClass import BasicOperation
+from mohupy.core.operationLib import archimedeanDict
+
+
+class PerElementOperation:
+    # 原有实现：每次运算都按 Config.arch 查找核函数，并为 md 与 nmd 各调用一次
+
+    def __init__(self, qrung, mtype):
+        self.qrung = qrung
+        self.mtype = mtype
+
+    def __binary(self, op, x, y):
+        newfn = Fuzznum()
+        newfn.mtype = self.mtype
+        newfn.qrung = self.qrung
+        newfn.md = archimedeanDict[Config.arch][op][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[0]
+        newfn.nmd = archimedeanDict[Config.arch][op][self.mtype](x.md, x.nmd, y.md, y.nmd, self.qrung)[1]
+        return newfn
+
+    def __scalar(self, op, l, x):
+        newfn = Fuzznum()
+        newfn.mtype = self.mtype
+        newfn.qrung = self.qrung
+        newfn.md = archimedeanDict[Config.arch][op][self.mtype](l, x.md, x.nmd, self.qrung)[0]
+        newfn.nmd = archimedeanDict[Config.arch][op][self.mtype](l, x.md, x.nmd, self.qrung)[1]
+        return newfn
+
+    def add(self, x, y):
+        return self.__binary('add', x, y)
+
+    def sub(self, x, y):
+        return self.__binary('sub', x, y)
+
+    def mul(self, x, y):
+        return self.__binary('mul', x, y)
+
+    def div(self, x, y):
+        return self.__binary('div', x, y)
+
+    def power(self, l, x):
+        return self.__scalar('pow', l, x)
+
+    def times(self, l, x):
+        return self.__scalar('tim', l, x)
+
+
+def operands(q, n, rng):
+    md = rng.uniform(0., 1., (2, n))
+    nmd = rng.uniform(0., 1., (2, n)) * (1. - md ** q) ** (1. / q)
+    x = [mp.fuzznum(q, m, v) for m, v in zip(md[0], nmd[0])]
+    y = [mp.fuzznum(q, m, v) for m, v in zip(md[1], nmd[1])]
+    return x, y
+
+
+def bench(n=2000, repeat=5, q=3):
+    rng = np.random.default_rng(0)
+    x, y = operands(q, n, rng)
+    l = rng.uniform(0.1, 3., n)
+    old, new = PerElementOperation(q, 'qrofn'), BasicOperation(q, 'qrofn')
+
+    print(f'arch = {Config.arch}, q = {q}, {n} pairs, best of {repeat}')
+    print(f'{"op":<8}{"per-element":>14}{"cached":>12}{"speedup":>10}')
+    for op in ('add', 'sub', 'mul', 'div', 'power', 'times'):
+        if op in ('power', 'times'):
+            args = list(zip(l, x))
+        else:
+            args = list(zip(x, y))
+        f_old, f_new = getattr(old, op), getattr(new, op)
+        # 结果须逐元素一致
+        for a, b in args[:100]:
+            r_old, r_new = f_old(a, b), f_new(a, b)
+            assert r_old.md == r_new.md and r_old.nmd == r_new.nmd, op
+        t_old = min(timeit.repeat(lambda: [f_old(a, b) for a, b in args], number=1, repeat=repeat))
+        t_new = min(timeit.repeat(lambda: [f_new(a, b) for a, b in args], number=1, repeat=repeat))
+        print(f'{op:<8}{t_old * 1e6 / n:>11.2f} us{t_new * 1e6 / n:>9.2f} us{t_old / t_new:>9.2f}x')
+
+
+if __name__ == '__main__':
+    bench(*(int(a) for a in sys.argv[1:3]))
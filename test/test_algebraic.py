@@ -0,0 +1,81 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Software: MohuPy
+
+import numpy as np
+
+from mohupy.core.constant import Approx
+from mohupy.core.operationLib.algebraic import algebraic_sub, algebraic_div
+
+
+def scalar_sub(x0, y0, x1, y1, q):
+    # 原有的逐元素实现，作为对照
+    if x0 == 0. and y0 == 1.:
+        return 0., 1.
+    if x1 == 1. or y1 == 0.:
+        return 0., 1.
+    if 0. <= y0 / y1 <= ((1 - x0 ** q) / (1 - x1 ** q)) ** (1 / q) <= 1.:
+        md = np.round(((x0 ** q - x1 ** q) / (1 - x1 ** q)) ** (1 / q), Approx.round)
+        nmd = np.round(y0 / y1, Approx.round)
+        return md, nmd
+    return 0., 1.
+
+
+def scalar_div(x0, y0, x1, y1, q):
+    if x0 == 1. and y0 == 0.:
+        return 1., 0.
+    if x1 == 0. or y1 == 1.:
+        return 1., 0.
+    if 0. <= x0 / x1 <= ((1 - y0 ** q) / (1 - y1 ** q)) ** (1 / q) <= 1.:
+        md = np.round(x0 / x1, Approx.round)
+        nmd = np.round(((y0 ** q - y1 ** q) / (1 - y1 ** q)) ** (1 / q), Approx.round)
+        return md, nmd
+    return 1., 0.
+
+
+def operands(q, n, rng):
+    """
+        Random q-rofn pairs with boundary values (md = 1, nmd = 0, the zero
+        and unit elements) and equal operands mixed in.
+    """
+    md = rng.uniform(size=(2, n))
+    nmd = rng.uniform(size=(2, n)) * (1 - md ** q) ** (1 / q)
+    edge = np.array([[1., 0.], [0., 1.], [0., 0.], [0.5, 0.], [1., 0.], [0.3, 1. - 1e-9]])
+    k = rng.integers(0, len(edge), size=(2, n))
+    pick = rng.uniform(size=(2, n)) < 0.2
+    md = np.where(pick, edge[k, 0], md)
+    nmd = np.where(pick, np.minimum(edge[k, 1], (1 - md ** q) ** (1 / q)), nmd)
+    same = rng.uniform(size=n) < 0.1
+    md[1, same], nmd[1, same] = md[0, same], nmd[0, same]
+    return md[0], nmd[0], md[1], nmd[1]
+
+
+def check(array_op, scalar_op):
+    rng = np.random.default_rng(2024)
+    for q in (1, 2, 3, 5):
+        x0, y0, x1, y1 = operands(q, 5000, rng)
+        md, nmd = array_op(x0, y0, x1, y1, q)
+        for i in range(x0.size):
+            m, n = scalar_op(x0[i], y0[i], x1[i], y1[i], q)
+            assert md[i] == m and nmd[i] == n, (q, x0[i], y0[i], x1[i], y1[i])
+            # 0 维输入仍返回标量
+            m0, n0 = array_op(x0[i], y0[i], x1[i], y1[i], q)
+            assert np.ndim(m0) == 0 and m0 == m and n0 == n
+
+
+def test_algebraic_sub_matches_scalar():
+    check(algebraic_sub, scalar_sub)
+
+
+def test_algebraic_div_matches_scalar():
+    check(algebraic_div, scalar_div)
+
+
+def test_boundary_operands():
+    for q in (1, 2, 3):
+        assert algebraic_sub(0., 1., 0.4, 0.3, q) == (0., 1.)
+        assert algebraic_sub(0.6, 0.2, 1., 0., q) == (0., 1.)
+        assert algebraic_div(1., 0., 0.4, 0.3, q) == (1., 0.)
+        assert algebraic_div(0.6, 0.2, 0., 1., q) == (1., 0.)
+        assert algebraic_sub(0.6, 0.2, 0.6, 0.2, q) == scalar_sub(0.6, 0.2, 0.6, 0.2, q)
+        assert algebraic_div(0.6, 0.2, 0.6, 0.2, q) == scalar_div(0.6, 0.2, 0.6, 0.2, q)
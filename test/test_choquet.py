@@ -0,0 +1,42 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Software: MohuPy
+
+import warnings
+
+import numpy as np
+
+import mohupy as mp
+from mohupy import measure as mm
+from mohupy.config import Config
+
+
+def _rows(md, nmd, q):
+    return mp.fuzzset([[mp.fuzznum(q, m, n) for m, n in zip(a, b)] for a, b in zip(md, nmd)])
+
+
+def test_fuzz_choquet_zero_weight_boundary():
+    # 得分最高的准则链权重为 0 且 nmd = 0
+    x = _rows([[0.9, 0.3, 0.5]], [[0.0, 0.4, 0.2]], 2)
+    table = [0, 0, 0.3, 0.3, 0.5, 0.5, 1, 1]
+    arch = Config.arch
+    try:
+        for a in ('algebraic', 'einstein'):
+            Config.arch = a
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                md, nmd = mm.fuzz_choquet(x, table).columns
+            # 第一个准则不参与聚合，结果等于其余两个准则各取 0.5 权重
+            ref = mm.fuzz_choquet(_rows([[0.3, 0.5]], [[0.4, 0.2]], 2), [0, 0.5, 0.5, 1])
+            assert not np.isnan(nmd).any()
+            assert np.allclose(md, ref.columns[0]) and np.allclose(nmd, ref.columns[1])
+    finally:
+        Config.arch = arch
+
+
+def test_fuzz_choquet_additive_is_mean():
+    x = _rows(np.full((3, 4), 0.6), np.linspace(0., 0.5, 12).reshape(3, 4), 3)
+    table = [bin(k).count('1') / 4 for k in range(16)]
+    md, nmd = mm.fuzz_choquet(x, table).columns
+    m, n = x.mean(axis=-1).columns
+    assert np.allclose(md, m) and np.allclose(nmd, n)
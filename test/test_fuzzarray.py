@@ -0,0 +1,62 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Software: MohuPy
+
+import numpy as np
+
+import mohupy as mp
+from mohupy.config import Config
+from mohupy.core.construct import FuzzSetFromArrays
+
+
+def test_object_mode_sees_in_place_changes():
+    f = mp.fuzzset(np.array([mp.fuzznum(2, .5, .3), mp.fuzznum(2, .2, .6)]))
+    assert np.allclose(f.score, [0.16, -0.32])
+    f.array[0] = mp.fuzznum(2, .9, .1)
+    assert np.allclose(f.score, [0.8, -0.32])
+    f.array[1].md = 0.7
+    assert np.allclose(f.score, [0.8, 0.13])
+    assert np.allclose(f.acc, [0.82, 0.85])
+    assert np.allclose(f.md, [0.9, 0.7])
+
+
+def test_columnar_cache_follows_columns():
+    f = mp.fuzzset_from_arrays([.5, .2], [.3, .6], 2)
+    s = f.score
+    # 返回的是副本，修改结果不影响缓存
+    s[0] = 1.
+    assert np.allclose(f.score, [0.16, -0.32])
+    f.columns = ([.9, .2], [.1, .6])
+    assert np.allclose(f.score, [0.8, -0.32])
+
+
+def test_degrees_layout_in_both_modes():
+    # 两种存储模式下 md / nmd 的布局一致，且都返回可写的新数组
+    cases = {
+        'qrofn': [mp.fuzznum(2, .5, .3), mp.fuzznum(2, .2, .6)],
+        'ivfn': [mp.fuzznum(2, (.1, .5), (.3, .4)), mp.fuzznum(2, (.2, .3), (.5, .6))],
+        'qrohfn': [mp.fuzznum(2, [.1, .5], [.3]), mp.fuzznum(2, [.2], [.5, .6, .1])],
+    }
+    mtype = Config.mtype
+    try:
+        for t, elements in cases.items():
+            Config.mtype = t
+            check_degrees(t, elements)
+    finally:
+        Config.mtype = mtype
+
+
+def check_degrees(mtype, elements):
+    obj = mp.fuzzset(elements)
+    col = FuzzSetFromArrays(2, mtype=mtype)(*obj.columns)
+    assert obj.mtype == mtype and not obj.columnar and col.columnar
+    for name in ('md', 'nmd'):
+        a, b = getattr(obj, name), getattr(col, name)
+        assert a.dtype == b.dtype == (np.float64 if mtype == 'qrofn' else object)
+        assert a.shape == b.shape == (2,)
+        for u, v, e in zip(a, b, elements):
+            assert np.array_equal(np.asarray(u, dtype=np.float64), getattr(e, name))
+            assert np.array_equal(np.asarray(v, dtype=np.float64), getattr(e, name))
+        assert a.flags.writeable and b.flags.writeable
+        b[0] = 9.
+        assert not np.array_equal(getattr(col, name)[0], 9.)
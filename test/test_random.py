@@ -0,0 +1,31 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Software: MohuPy
+
+import numpy as np
+
+from mohupy.config import Config
+from mohupy.corelib.regedit import fuzzRandomSet
+
+
+def test_random_set_ignores_config_mtype():
+    # 随机数组的类型由生成函数决定，与 Config.mtype 无关
+    mtype = Config.mtype
+    try:
+        for config in ('qrofn', 'ivfn', 'qrohfn'):
+            Config.mtype = config
+            for t, args in (('qrofn', ()), ('ivfn', ()), ('qrohfn', (1, 3))):
+                x = fuzzRandomSet[t](2, (3,), *args, rng=np.random.default_rng(0))
+                assert x.mtype == t and x.shape == (3,)
+    finally:
+        Config.mtype = mtype
+
+
+def test_random_qrohfn_set_degrees():
+    x = fuzzRandomSet['qrohfn'](3, (4, 5), 1, 4, rng=np.random.default_rng(1))
+    md, nmd = x.columns
+    assert md.shape == nmd.shape == (4, 5)
+    lengths = md.lengths
+    assert np.all((lengths >= 1) & (lengths < 4))
+    m0, m1 = md.reduce(np.maximum, 0.), nmd.reduce(np.maximum, 0.)
+    assert np.all(m0 ** 3 + m1 ** 3 <= 1.)
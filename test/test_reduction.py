@@ -0,0 +1,42 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Software: MohuPy
+
+import warnings
+
+import numpy as np
+
+from mohupy.core.operationLib import reductionDict
+from mohupy.core.operationLib.reduction import weighted
+
+
+def test_weighted_zero_weight_at_boundary():
+    # 权重为 0 的项即使生成元为 -inf 也应被忽略
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        t = weighted(np.array([-np.inf, np.log(0.5)]), np.array([0., 1.]))
+    assert np.array_equal(t, [0., np.log(0.5)])
+
+
+def test_weighted_sum_boundary_degrees():
+    md = np.array([[1., 0.3, 0.5]])
+    nmd = np.array([[0., 0.4, 0.2]])
+    w = np.array([[0., 0.5, 0.5]])
+    for arch in ('algebraic', 'einstein'):
+        for op in ('sum', 'prod'):
+            kernel = reductionDict[arch][op]['qrofn']
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                m, n = kernel(md, nmd, 2, (1,), False, w)
+                m0, n0 = kernel(md[:, 1:], nmd[:, 1:], 2, (1,), False, w[:, 1:])
+            assert np.array_equal(m, m0) and np.array_equal(n, n0), (arch, op)
+            assert not np.any(np.isnan(m)) and not np.any(np.isnan(n))
+
+
+def test_weighted_sum_closed_form():
+    rng = np.random.default_rng(0)
+    md, nmd = rng.uniform(size=(2, 50, 6)) * 0.7
+    w = rng.uniform(size=(50, 6))
+    m, n = reductionDict['algebraic']['sum']['qrofn'](md, nmd, 3, (1,), False, w)
+    assert np.allclose(m, (1 - np.prod((1 - md ** 3) ** w, axis=1)) ** (1 / 3), atol=1e-6)
+    assert np.allclose(n, np.prod(nmd ** w, axis=1), atol=1e-6)
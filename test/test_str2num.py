@@ -0,0 +1,41 @@
+#  Copyright (c) yibocat 2024 All Rights Reserved
+#  Python: 3.10.9
+#  Software: MohuPy
+
+import numpy as np
+import pytest
+
+from mohupy.corelib.regedit.str2num import fuzzString, str2fuzz_batch
+
+VALID = {
+    'qrofn': ['<0.3,0.4>', '[0.3 0.4]', '{0.3, 0.4}', ' < 0.3 , 0.4 > '],
+    'ivfn': ['<[0.1,0.2],[0.3,0.4]>', '[[0.1 0.2], [0.3 0.4]]', '{[0.1,0.2][0.3,0.4]}'],
+    'qrohfn': ['<[0.1,0.2,0.3],[0.4]>', '[[0.1 0.2], []]', '{[0.1],[0.3, 0.4]}'],
+}
+
+# 缺少或不匹配的括号
+INVALID = {
+    'qrofn': ['<0.3,0.4', '0.3,0.4>', '{0.3,0.4)', '<0.3,0.4]', '[0.3,0.4}', '(0.3,0.4)', '0.3,0.4'],
+    'ivfn': ['<[0.1,0.2],[0.3,0.4]', '[0.1,0.2],[0.3,0.4]', '[[0.1,0.2],[0.3,0.4]>',
+             '{[0.1,0.2],[0.3,0.4]]', '[[0.1,0.2],[0.3,0.4]'],
+    'qrohfn': ['<[0.1,0.2],[0.4]', '[0.1,0.2],[0.4]>', '{[0.1],[0.4]>', '<[0.1],[0.4]]'],
+}
+
+
+@pytest.mark.parametrize('mtype', ['qrofn', 'ivfn', 'qrohfn'])
+def test_matched_brackets(mtype):
+    for s in VALID[mtype]:
+        fn = fuzzString[mtype](s, 2)
+        e = str2fuzz_batch([s], 2, mtype)[0]
+        assert fn.mtype == e.mtype == mtype
+        assert np.array_equal(fn.md, e.md) and np.array_equal(fn.nmd, e.nmd)
+
+
+@pytest.mark.parametrize('mtype', ['qrofn', 'ivfn', 'qrohfn'])
+def test_unbalanced_brackets(mtype):
+    for s in INVALID[mtype]:
+        with pytest.raises(AssertionError, match='data format error'):
+            fuzzString[mtype](s, 2)
+        # 批量解析中的一个错误单元格同样被拒绝
+        with pytest.raises(AssertionError, match='data format error'):
+            str2fuzz_batch(np.array([VALID[mtype][0], s], dtype=object), 2, mtype)